@@ -5,8 +5,44 @@ from typing import Tuple
 
 import pygame
 
+# Integer kind tags so hot paths can branch on an int compare instead of
+# isinstance/hasattr checks.
+KIND_NONE = 0
+KIND_ENEMY = 1
+KIND_HOSTAGE = 2
+KIND_OBJECT = 3
+KIND_BOSS = 4
+
+# Prerendered shape surfaces keyed by their parameters. Actors of the same
+# type share one surface, so per-frame drawing appends a blit to the stage
+# batch instead of running a pygame.draw call per actor.
+_SPRITE_CACHE: dict = {}
+
+
+def rect_sprite(color: Tuple[int, int, int], size: Tuple[int, int],
+                border_radius: int = 8, width: int = 0) -> pygame.Surface:
+    key = (color, size, border_radius, width)
+    sprite = _SPRITE_CACHE.get(key)
+    if sprite is None:
+        sprite = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(sprite, color, sprite.get_rect(), width=width, border_radius=border_radius)
+        _SPRITE_CACHE[key] = sprite
+    return sprite
+
+
+def ellipse_sprite(color: Tuple[int, int, int], size: Tuple[int, int]) -> pygame.Surface:
+    key = ("ellipse", color, size)
+    sprite = _SPRITE_CACHE.get(key)
+    if sprite is None:
+        sprite = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.ellipse(sprite, color, sprite.get_rect())
+        _SPRITE_CACHE[key] = sprite
+    return sprite
+
 
 class Actor:
+    KIND = KIND_NONE
+
     def __init__(self, position: Tuple[float, float]) -> None:
         self.position = pygame.Vector2(position)
         self.rect = pygame.Rect(0, 0, 64, 64)
@@ -14,10 +50,16 @@ class Actor:
         self.alive = True
 
     def update(self, dt: float, stage_state) -> None:
-        self.rect.center = (int(self.position.x), int(self.position.y))
+        center = (int(self.position.x), int(self.position.y))
+        if center != self.rect.center:
+            self.rect.center = center
 
     def draw(self, surface: pygame.Surface, camera) -> None:  # pragma: no cover - drawing
         raise NotImplementedError
 
+    def draw_batch(self, batch: list, camera) -> None:  # pragma: no cover - drawing
+        """Append ``(sprite, dest)`` pairs for one batched blits call."""
+        raise NotImplementedError
+
     def take_damage(self, amount: float, stage_state, headshot: bool = False) -> None:
         pass
@@ -6,10 +6,10 @@ from typing import List
 
 import pygame
 
-from actors.base import Actor
+from actors.base import KIND_BOSS, Actor
 
 
-@dataclass
+@dataclass(slots=True)
 class BossPhase:
     threshold: float
     weak_spots: List[pygame.Rect]
@@ -17,20 +17,29 @@ class BossPhase:
 
 
 class Boss(Actor):
+    KIND = KIND_BOSS
+
     def __init__(self, position, max_health: float, phases: List[BossPhase]) -> None:
         super().__init__(position)
         self.rect.size = (200, 200)
         self.rect.midbottom = position
         self.health = max_health
         self.max_health = max_health
-        self.phases = phases
+        # Descending thresholds let _update_phase stop at the first miss.
+        self.phases = sorted(phases, key=lambda phase: phase.threshold, reverse=True)
+        self._phase_hp = [max_health * phase.threshold for phase in self.phases]
         self.phase_index = 0
         self.attack_timer = phases[0].attack_interval
         self.weak_spot = phases[0].weak_spots[0]
         self.phase_bar_rect = pygame.Rect(200, 40, 880, 16)
+        self._weak_world: pygame.Rect | None = None
+        self._weak_anchor: tuple[int, int] | None = None
 
     def update(self, dt: float, stage_state) -> None:
-        super().update(dt, stage_state)
+        rect = self.rect
+        center = (int(self.position.x), int(self.position.y))
+        if center != rect.center:
+            rect.center = center
         self.attack_timer -= dt
         if self.attack_timer <= 0:
             stage_state.player.take_damage(2, stage_state)
@@ -38,19 +47,34 @@ class Boss(Actor):
         self._update_phase()
 
     def _update_phase(self) -> None:
-        for idx, phase in enumerate(self.phases):
-            if self.health <= self.max_health * phase.threshold:
-                self.phase_index = idx
-                self.weak_spot = phase.weak_spots[idx % len(phase.weak_spots)]
-                self.attack_timer = max(1.0, phase.attack_interval * 0.9)
+        health = self.health
+        new_index = self.phase_index
+        for idx, phase_hp in enumerate(self._phase_hp):
+            if health <= phase_hp:
+                new_index = idx
+            else:
+                break
+        if new_index != self.phase_index:
+            self.phase_index = new_index
+            phase = self.phases[new_index]
+            self.weak_spot = phase.weak_spots[new_index % len(phase.weak_spots)]
+            self.attack_timer = max(1.0, phase.attack_interval * 0.9)
+            self._weak_anchor = None
 
     def current_phase(self) -> BossPhase:
         return self.phases[self.phase_index]
 
+    def weak_world_rect(self) -> pygame.Rect:
+        """World-space weak spot, cached until the boss or spot moves."""
+        anchor = self.rect.topleft
+        if self._weak_world is None or self._weak_anchor != anchor:
+            self._weak_world = self.weak_spot.move(anchor)
+            self._weak_anchor = anchor
+        return self._weak_world
+
     def take_damage(self, amount: float, stage_state, headshot: bool = False) -> None:
-        weak = self.weak_spot.move(self.rect.topleft)
-        cursor_world = stage_state.camera.screen_to_world(pygame.mouse.get_pos())
-        if weak.collidepoint(cursor_world):
+        weak = self.weak_world_rect()
+        if weak.collidepoint(stage_state.cursor_world):
             self.health -= amount
             stage_state.spawn_hit_spark(weak.center)
             if self.health <= 0:
@@ -62,8 +86,7 @@ class Boss(Actor):
     def draw(self, surface, camera) -> None:  # pragma: no cover
         rect = camera.apply(self.rect)
         pygame.draw.rect(surface, (150, 60, 60), rect, border_radius=18)
-        weak = self.weak_spot.copy()
-        weak = camera.apply(weak.move(self.rect.topleft))
+        weak = camera.apply(self.weak_world_rect())
         pygame.draw.rect(surface, (255, 220, 80), weak, border_radius=8)
         # Health bar
         ratio = max(0.0, self.health / self.max_health)
@@ -1,28 +1,52 @@
 """Enemy hierarchy with simple behaviours."""
 from __future__ import annotations
 
+import math
+from functools import partial
+
 import pygame
 
-from actors.base import Actor
+from actors.base import KIND_ENEMY, Actor, ellipse_sprite, rect_sprite
+
+# The sniper laser has fixed geometry relative to its muzzle, so one
+# prerendered strip per color covers every sniper on screen.
+_LASER_CACHE: dict = {}
+
+
+def _laser_sprite(color: tuple[int, int, int]) -> pygame.Surface:
+    sprite = _LASER_CACHE.get(color)
+    if sprite is None:
+        sprite = pygame.Surface((1001, 104), pygame.SRCALPHA)
+        pygame.draw.line(sprite, color, (0, 102), (1000, 2), 2)
+        _LASER_CACHE[color] = sprite
+    return sprite
 
 
 class Enemy(Actor):
+    KIND = KIND_ENEMY
+
     def __init__(self, position, health: int, color: tuple[int, int, int]) -> None:
         super().__init__(position)
         self.health = health
         self.color = color
-        self.head_rect = pygame.Rect(0, 0, self.rect.width // 2, self.rect.height // 3)
-        self.head_rect.midbottom = self.rect.midtop
         self.cover = None
         self.attack_timer = 2.0
 
     def update(self, dt: float, stage_state) -> None:
-        super().update(dt, stage_state)
-        self.head_rect.midbottom = self.rect.midtop
+        center = (int(self.position.x), int(self.position.y))
+        if center != self.rect.center:
+            self.rect.center = center
         self.attack_timer -= dt
         if self.attack_timer <= 0:
             self.perform_attack(stage_state)
 
+    def head_rect(self) -> pygame.Rect:
+        """Head hitbox derived from the body rect, built only when needed."""
+        rect = self.rect
+        width = rect.width // 2
+        height = rect.height // 3
+        return pygame.Rect(rect.centerx - width // 2, rect.top - height, width, height)
+
     def perform_attack(self, stage_state) -> None:
         stage_state.player.take_damage(1, stage_state)
         self.attack_timer = 2.5
@@ -37,12 +61,11 @@ class Enemy(Actor):
             self.alive = False
             stage_state.on_enemy_killed(self)
 
-    def draw(self, surface: pygame.Surface, camera) -> None:  # pragma: no cover
+    def draw_batch(self, batch: list, camera) -> None:  # pragma: no cover
         rect = camera.apply(self.rect)
-        pygame.draw.rect(surface, self.color, rect, border_radius=8)
-        head = self.head_rect.copy()
-        head = camera.apply(head)
-        pygame.draw.ellipse(surface, (220, 210, 190), head)
+        batch.append((rect_sprite(self.color, rect.size), rect))
+        head = camera.apply(self.head_rect())
+        batch.append((ellipse_sprite((220, 210, 190), head.size), head))
 
 
 class ShieldEnemy(Enemy):
@@ -59,11 +82,10 @@ class ShieldEnemy(Enemy):
         else:
             super().take_damage(amount, stage_state, headshot)
 
-    def draw(self, surface, camera) -> None:  # pragma: no cover
-        super().draw(surface, camera)
-        rect = camera.apply(self.rect)
-        shield_rect = rect.inflate(20, 10)
-        pygame.draw.rect(surface, (80, 160, 220), shield_rect, width=4, border_radius=12)
+    def draw_batch(self, batch: list, camera) -> None:  # pragma: no cover
+        super().draw_batch(batch, camera)
+        shield_rect = camera.apply(self.rect).inflate(20, 10)
+        batch.append((rect_sprite((80, 160, 220), shield_rect.size, border_radius=12, width=4), shield_rect))
 
 
 class SniperEnemy(Enemy):
@@ -80,11 +102,10 @@ class SniperEnemy(Enemy):
             stage_state.hud.add_message("Sniper Shot!", (255, 120, 120))
             self.charge_time = 3.5
 
-    def draw(self, surface, camera) -> None:  # pragma: no cover
-        super().draw(surface, camera)
-        start = camera.world_to_screen(pygame.Vector2(self.rect.centerx, self.rect.centery))
-        end = start + pygame.Vector2(1000, -100)
-        pygame.draw.line(surface, self.laser_color, start, end, 2)
+    def draw_batch(self, batch: list, camera) -> None:  # pragma: no cover
+        super().draw_batch(batch, camera)
+        start_x, start_y = camera.apply_xy(self.rect.centerx, self.rect.centery)
+        batch.append((_laser_sprite(self.laser_color), (start_x, start_y - 102)))
 
 
 class BomberEnemy(Enemy):
@@ -109,11 +130,10 @@ class TurretEnemy(Enemy):
         stage_state.player.take_damage(1, stage_state)
         self.attack_timer = 1.2
 
-    def draw(self, surface, camera) -> None:  # pragma: no cover
+    def draw_batch(self, batch: list, camera) -> None:  # pragma: no cover
         rect = camera.apply(self.rect)
-        pygame.draw.rect(surface, (120, 120, 120), rect)
-        barrel = pygame.Rect(rect.centerx, rect.centery - 10, 40, 20)
-        pygame.draw.rect(surface, (180, 180, 180), barrel)
+        batch.append((rect_sprite((120, 120, 120), rect.size, border_radius=0), rect))
+        batch.append((rect_sprite((180, 180, 180), (40, 20), border_radius=0), (rect.centerx, rect.centery - 10)))
 
 
 class MeleeEnemy(Enemy):
@@ -122,17 +142,25 @@ class MeleeEnemy(Enemy):
         self.speed = 80
 
     def update(self, dt: float, stage_state) -> None:
-        direction = pygame.Vector2(stage_state.player.rect.center) - self.position
-        if direction.length() > 5:
-            self.position += direction.normalize() * self.speed * dt
+        # Scalar math instead of Vector2 chaining: the old expression built
+        # three temporary vectors per melee enemy per frame.
+        position = self.position
+        player_x, player_y = stage_state.player.rect.center
+        dx = player_x - position.x
+        dy = player_y - position.y
+        distance_sq = dx * dx + dy * dy
+        if distance_sq > 25.0:
+            scale = self.speed * dt / math.sqrt(distance_sq)
+            position.x += dx * scale
+            position.y += dy * scale
         super().update(dt, stage_state)
 
 
 ENEMY_FACTORIES = {
-    "grunt": lambda pos: Enemy(pos, health=60, color=(160, 80, 80)),
-    "shield": lambda pos: ShieldEnemy(pos),
-    "sniper": lambda pos: SniperEnemy(pos),
-    "bomber": lambda pos: BomberEnemy(pos),
-    "turret": lambda pos: TurretEnemy(pos),
-    "melee": lambda pos: MeleeEnemy(pos),
+    "grunt": partial(Enemy, health=60, color=(160, 80, 80)),
+    "shield": ShieldEnemy,
+    "sniper": SniperEnemy,
+    "bomber": BomberEnemy,
+    "turret": TurretEnemy,
+    "melee": MeleeEnemy,
 }
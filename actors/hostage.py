@@ -3,10 +3,12 @@ from __future__ import annotations
 
 import pygame
 
-from actors.base import Actor
+from actors.base import KIND_HOSTAGE, Actor, ellipse_sprite, rect_sprite
 
 
 class Hostage(Actor):
+    KIND = KIND_HOSTAGE
+
     def __init__(self, position) -> None:
         super().__init__(position)
         self.rect.size = (60, 100)
@@ -27,14 +29,17 @@ class Hostage(Actor):
             self.alive = False
 
     def update(self, dt: float, stage_state) -> None:
-        super().update(dt, stage_state)
-        self.rope_rect.midtop = self.rect.midtop
+        rect = self.rect
+        center = (int(self.position.x), int(self.position.y))
+        if center != rect.center:
+            rect.center = center
+            self.rope_rect.midtop = rect.midtop
 
-    def draw(self, surface, camera) -> None:  # pragma: no cover
+    def draw_batch(self, batch: list, camera) -> None:  # pragma: no cover
         rect = camera.apply(self.rect)
         rope = camera.apply(self.rope_rect)
-        pygame.draw.rect(surface, (200, 180, 80), rope)
-        pygame.draw.rect(surface, (180, 220, 120), rect, border_radius=12)
+        batch.append((rect_sprite((200, 180, 80), rope.size, border_radius=0), rope))
+        batch.append((rect_sprite((180, 220, 120), rect.size, border_radius=12), rect))
         head = pygame.Rect(0, 0, rect.width // 2, rect.height // 3)
         head.midbottom = rect.midtop
-        pygame.draw.ellipse(surface, (240, 220, 180), head)
+        batch.append((ellipse_sprite((240, 220, 180), head.size), head))
@@ -3,10 +3,12 @@ from __future__ import annotations
 
 import pygame
 
-from actors.base import Actor
+from actors.base import KIND_OBJECT, Actor, rect_sprite
 
 
 class ExplosiveBarrel(Actor):
+    KIND = KIND_OBJECT
+
     def __init__(self, position) -> None:
         super().__init__(position)
         self.rect.size = (50, 70)
@@ -19,13 +21,16 @@ class ExplosiveBarrel(Actor):
             self.alive = False
             stage_state.on_barrel_exploded(self)
 
-    def draw(self, surface, camera) -> None:  # pragma: no cover
+    def draw_batch(self, batch: list, camera) -> None:  # pragma: no cover
         rect = camera.apply(self.rect)
-        pygame.draw.rect(surface, (200, 80, 60), rect, border_radius=6)
-        pygame.draw.rect(surface, (255, 200, 80), rect.inflate(-10, -10), 0, border_radius=4)
+        batch.append((rect_sprite((200, 80, 60), rect.size, border_radius=6), rect))
+        inner = rect.inflate(-10, -10)
+        batch.append((rect_sprite((255, 200, 80), inner.size, border_radius=4), inner))
 
 
 class CoinCrate(Actor):
+    KIND = KIND_OBJECT
+
     def __init__(self, position, coins: int = 10) -> None:
         super().__init__(position)
         self.rect.size = (60, 60)
@@ -37,7 +42,8 @@ class CoinCrate(Actor):
             self.alive = False
             stage_state.on_coin_crate_broken(self)
 
-    def draw(self, surface, camera) -> None:  # pragma: no cover
+    def draw_batch(self, batch: list, camera) -> None:  # pragma: no cover
         rect = camera.apply(self.rect)
-        pygame.draw.rect(surface, (200, 180, 60), rect, border_radius=8)
-        pygame.draw.rect(surface, (120, 80, 20), rect.inflate(-8, -8), 2, border_radius=6)
+        batch.append((rect_sprite((200, 180, 60), rect.size, border_radius=8), rect))
+        inner = rect.inflate(-8, -8)
+        batch.append((rect_sprite((120, 80, 20), inner.size, border_radius=6, width=2), inner))
@@ -6,13 +6,11 @@ from typing import Dict
 
 import pygame
 
-from actors.base import Actor
-from actors.hostage import Hostage
-from systems.collision import hitscan
+from actors.base import KIND_ENEMY, KIND_HOSTAGE, Actor
 from systems.particles import ParticleSystem
 
 
-@dataclass
+@dataclass(slots=True)
 class WeaponStats:
     id: str
     damage: int
@@ -51,10 +49,16 @@ class Player(Actor):
         self.combo_decay = 0.0
         self.invulnerable = False
         self.powerups: Dict[str, float] = {}
+        self._powerups_dirty = False
+        self._powerup_sync_timer = 0.0
+        self._recompute_effective()
 
     def update(self, dt: float, stage_state) -> None:
-        super().update(dt, stage_state)
-        self.rect.midbottom = (self.rect.midbottom[0], stage_state.ground_y)
+        rect = self.rect
+        center = (int(self.position.x), int(self.position.y))
+        if center != rect.center:
+            rect.center = center
+        rect.midbottom = (rect.centerx, stage_state.ground_y)
         self.combo_decay = max(0.0, self.combo_decay - dt)
         if self.combo_decay == 0:
             self.combo_hits = 0
@@ -65,14 +69,45 @@ class Player(Actor):
             self.duck_timer -= dt
             if self.duck_timer <= 0:
                 self.invulnerable = False
-        for key in list(self.powerups.keys()):
-            self.powerups[key] = max(0.0, self.powerups[key] - dt)
-            if self.powerups[key] == 0:
-                self.powerups.pop(key)
-                if key == "armor":
-                    self.invulnerable = False
-        for name, time_left in self.powerups.items():
-            self.hud.set_powerup_timer(name, time_left)
+        powerups = self.powerups
+        if powerups:
+            expired = False
+            for key, time_left in list(powerups.items()):
+                time_left = max(0.0, time_left - dt)
+                if time_left == 0:
+                    powerups.pop(key)
+                    expired = True
+                    if key == "armor":
+                        self.invulnerable = False
+                else:
+                    powerups[key] = time_left
+            if expired:
+                self._powerups_dirty = True
+                self._recompute_effective()
+            # The HUD ticks its own timers, so a full push is only needed
+            # on change plus a once-a-second resync against drift.
+            self._powerup_sync_timer -= dt
+            if self._powerups_dirty or self._powerup_sync_timer <= 0:
+                hud_set = self.hud.set_powerup_timer
+                for key, time_left in powerups.items():
+                    hud_set(key, time_left)
+                self._powerup_sync_timer = 1.0
+                self._powerups_dirty = False
+
+    def _recompute_effective(self) -> None:
+        """Resolve powerup-modified weapon stats once per change.
+
+        ``shoot``/``reload`` run on every trigger pull, so they read the
+        cached values instead of probing the powerup dict per shot.
+        """
+        powerups = self.powerups
+        weapon = self.weapon
+        damage = weapon.damage * 1.5 if "armor_pierce" in powerups else weapon.damage
+        self._effective_damage = damage
+        self._effective_rof = weapon.rof * 0.5 if "rapid" in powerups else weapon.rof
+        self._effective_reload = weapon.reload_time * 0.7 if "reload" in powerups else weapon.reload_time
+        self._spread_active = "spread" in powerups
+        self.slow_active = "slow" in powerups
 
     def begin_duck(self) -> None:
         self.duck_timer = self.duck_duration
@@ -89,30 +124,29 @@ class Player(Actor):
         if not self.can_shoot():
             return
         self.ammo -= 1
-        rof = self.weapon.rof
-        if "rapid" in self.powerups:
-            rof *= 0.5
-        self.shoot_timer = rof
-        cursor_world = stage_state.camera.screen_to_world(pygame.mouse.get_pos())
-        target = hitscan(cursor_world, stage_state.get_shoot_targets())
-        muzzle_pos = pygame.Vector2(self.rect.centerx, self.rect.top + 20)
-        self.particles.spawn(muzzle_pos, pygame.Vector2(0, -20), 0.1, (255, 200, 100), 8)
+        self.shoot_timer = self._effective_rof
+        cursor_world = stage_state.cursor_world
+        target = stage_state.target_index.pick(cursor_world)
+        self.particles.spawn_xy(self.rect.centerx, self.rect.top + 20, 0, -20, 0.1, (255, 200, 100), 8)
         headshot = False
         if target:
-            if isinstance(target, Hostage):
+            kind = target.KIND
+            if kind == KIND_HOSTAGE:
                 if target.rope_rect.collidepoint(cursor_world):
                     target.rescue(stage_state)
                     stage_state.register_hit()
                     return
-            if hasattr(target, "head_rect"):
-                headshot = target.head_rect.collidepoint(cursor_world)
+            if kind == KIND_ENEMY:
+                headshot = target.head_rect().collidepoint(cursor_world)
             target.take_damage(self.get_damage(), stage_state, headshot=headshot)
-            if "spread" in self.powerups:
-                for extra in stage_state.enemies:
+            if self._spread_active:
+                cx = target.rect.centerx
+                spread_damage = self.weapon.damage * 0.6
+                for extra in stage_state.enemy_hash.query_range(cx - 120, cx + 120):
                     if extra is target:
                         continue
-                    if extra.rect.centerx in range(target.rect.centerx - 120, target.rect.centerx + 120):
-                        extra.take_damage(self.weapon.damage * 0.6, stage_state)
+                    if abs(extra.rect.centerx - cx) <= 120:
+                        extra.take_damage(spread_damage, stage_state)
             stage_state.register_hit(headshot=headshot)
         else:
             stage_state.register_miss()
@@ -121,10 +155,7 @@ class Player(Actor):
 
     def reload(self) -> None:
         if self.reload_timer == 0 and self.ammo < self.weapon.mag_size:
-            reload_time = self.weapon.reload_time
-            if "reload" in self.powerups:
-                reload_time *= 0.7
-            self.reload_timer = reload_time
+            self.reload_timer = self._effective_reload
             self.hud.add_message("Reloading", (180, 220, 255))
 
     def update_reload(self, dt: float) -> None:
@@ -148,12 +179,11 @@ class Player(Actor):
 
     def apply_powerup(self, name: str, duration: float) -> None:
         self.powerups[name] = duration
+        self._powerups_dirty = True
+        self._recompute_effective()
 
     def get_damage(self) -> float:
-        damage = self.weapon.damage
-        if "armor_pierce" in self.powerups:
-            damage *= 1.5
-        return damage
+        return self._effective_damage
 
     def switch_weapon(self, weapon_id: str) -> None:
         if weapon_id in WEAPON_DATA:
@@ -161,6 +191,7 @@ class Player(Actor):
             self.weapon = WEAPON_DATA[weapon_id]
             self.ammo = self.weapon.mag_size
             self.reload_timer = 0
+            self._recompute_effective()
             self.hud.add_message(f"Equipped {weapon_id.title()}", (200, 200, 255))
 
     def draw(self, surface: pygame.Surface, camera) -> None:  # pragma: no cover - drawing
@@ -3,7 +3,15 @@ from __future__ import annotations
 
 import pygame
 
-from actors.base import Actor
+from actors.base import Actor, rect_sprite
+
+_COLORS = {
+    "rapid": (255, 200, 80),
+    "spread": (80, 200, 255),
+    "armor": (100, 220, 120),
+    "slow": (200, 120, 255),
+    "health": (255, 100, 120),
+}
 
 
 class Powerup(Actor):
@@ -24,13 +32,6 @@ class Powerup(Actor):
     def apply(self, player) -> None:
         player.apply_powerup(self.type, self.duration)
 
-    def draw(self, surface, camera) -> None:  # pragma: no cover
+    def draw_batch(self, batch: list, camera) -> None:  # pragma: no cover
         rect = camera.apply(self.rect)
-        colors = {
-            "rapid": (255, 200, 80),
-            "spread": (80, 200, 255),
-            "armor": (100, 220, 120),
-            "slow": (200, 120, 255),
-            "health": (255, 100, 120),
-        }
-        pygame.draw.rect(surface, colors.get(self.type, (200, 200, 200)), rect, border_radius=10)
+        batch.append((rect_sprite(_COLORS.get(self.type, (200, 200, 200)), rect.size, border_radius=10), rect))
@@ -8,30 +8,47 @@ import pygame
 from utils.math import approach
 
 
-@dataclass
+@dataclass(slots=True)
 class Camera:
     width: int
     height: int
     position: pygame.Vector2
     target_x: float = 0.0
+    _ox: int = 0
+    _oy: int = 0
+    view_rect: pygame.Rect = None
 
     def __init__(self, width: int, height: int) -> None:
         self.width = width
         self.height = height
         self.position = pygame.Vector2(0, 0)
         self.target_x = 0.0
+        self.view_rect = pygame.Rect(0, 0, width, height)
+        self._refresh_offsets()
 
     def set_target(self, x: float) -> None:
         self.target_x = x
 
     def update(self, dt: float, speed: float = 600.0) -> None:
         self.position.x = approach(self.position.x, self.target_x, speed * dt)
+        self._refresh_offsets()
+
+    def _refresh_offsets(self) -> None:
+        # Cached once per frame so apply() is a single C-level Rect.move.
+        self._ox = -int(self.position.x)
+        self._oy = -int(self.position.y)
+        self.view_rect.topleft = (-self._ox, -self._oy)
 
     def apply(self, rect: pygame.Rect) -> pygame.Rect:
-        offset_rect = rect.copy()
-        offset_rect.x -= int(self.position.x)
-        offset_rect.y -= int(self.position.y)
-        return offset_rect
+        return rect.move(self._ox, self._oy)
+
+    def apply_xy(self, x: float, y: float) -> tuple[float, float]:
+        """Tuple-returning fast path for draw code that only needs coords."""
+        return x + self._ox, y + self._oy
+
+    def visible(self, rect: pygame.Rect) -> bool:
+        """Cheap viewport test used to cull offscreen actors before drawing."""
+        return self.view_rect.colliderect(rect)
 
     def world_to_screen(self, pos: pygame.Vector2) -> pygame.Vector2:
         return pygame.Vector2(pos.x - self.position.x, pos.y - self.position.y)
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Tuple
+from typing import Dict, Tuple
 
 import pygame
 
@@ -28,16 +28,31 @@ class Game:
         self.base_path = base_path
         self.clock = pygame.time.Clock()
         self.display = pygame.display.set_mode(WINDOW_SIZE, pygame.RESIZABLE)
+        # Nothing reads these from the queue (the cursor is polled with
+        # pygame.mouse.get_pos), so stop SDL from queueing them at all
+        # instead of iterating past hundreds of motion events per frame.
+        pygame.event.set_blocked([
+            pygame.MOUSEMOTION,
+            pygame.ACTIVEEVENT,
+            pygame.VIDEOEXPOSE,
+            pygame.JOYAXISMOTION,
+            pygame.JOYBALLMOTION,
+            pygame.JOYHATMOTION,
+        ])
         self.scene_manager = SceneManager()
         self.input = InputManager()
         self.camera = Camera(*WINDOW_SIZE)
         self.audio = AudioSystem(base_path / "assets")
         self.fonts = FontLibrary(base_path / "assets" / "fonts")
         self.save = SaveData(base_path / "data" / "save.json")
+        # Parsed data files (weapons/upgrades) are immutable at runtime, so
+        # scenes share one parse per path instead of re-reading on entry.
+        self._json_cache: Dict[Path, list] = {}
         self.running = True
         self.accumulator = 0.0
         self.scaled_surface = pygame.Surface(WINDOW_SIZE)
         self.letterbox = pygame.Rect(0, 0, *WINDOW_SIZE)
+        self._present_buf = pygame.Surface(WINDOW_SIZE)
         from systems.shop import ShopState
         from systems.stage_flow import StageSelectState, MainMenuState
 
@@ -71,6 +86,10 @@ class Game:
             if current:
                 current.draw(self.scaled_surface)
             self._present()
+            # Mutations mark the save dirty; one flush per frame collapses
+            # bursts (shop sprees, achievement sweeps) into a single write.
+            self.save.flush()
+        self.save.flush(force=True)
         pygame.quit()
 
     def _present(self) -> None:
@@ -78,8 +97,8 @@ class Game:
         if not window:
             return
         window.fill((0, 0, 0))
-        scaled = pygame.transform.smoothscale(self.scaled_surface, self.letterbox.size)
-        window.blit(scaled, self.letterbox.topleft)
+        pygame.transform.smoothscale(self.scaled_surface, self.letterbox.size, self._present_buf)
+        window.blit(self._present_buf, self.letterbox.topleft)
         pygame.display.flip()
 
     def _handle_resize(self, size: Tuple[int, int]) -> None:
@@ -96,6 +115,7 @@ class Game:
                 height = int(width / target_ratio)
             self.letterbox.size = (width, height)
             self.letterbox.center = (size[0] // 2, size[1] // 2)
+            self._present_buf = pygame.Surface(self.letterbox.size)
 
     def open_stage(self, stage_id: str) -> None:
         from systems.stage_flow import StageState
@@ -2,16 +2,28 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict
 
 import pygame
 
+# pygame keycodes are either small ASCII values or SDL scancodes with bit 30
+# set (e.g. arrow keys). Fold both ranges into a fixed-size index space so
+# key state fits in flat bytearrays instead of dicts.
+_EXTENDED_KEY_BIT = 1 << 30
+_STATE_SIZE = 1024
+_ZEROS = bytes(_STATE_SIZE)
 
-@dataclass
+
+def _key_index(key: int) -> int:
+    if key & _EXTENDED_KEY_BIT:
+        return 512 + (key & 0x1FF)
+    return key & 0x1FF
+
+
+@dataclass(slots=True)
 class InputState:
-    pressed: Dict[int, bool] = field(default_factory=dict)
-    down: Dict[int, bool] = field(default_factory=dict)
-    released: Dict[int, bool] = field(default_factory=dict)
+    pressed: bytearray = field(default_factory=lambda: bytearray(_STATE_SIZE))
+    down: bytearray = field(default_factory=lambda: bytearray(_STATE_SIZE))
+    released: bytearray = field(default_factory=lambda: bytearray(_STATE_SIZE))
 
 
 class InputManager:
@@ -21,28 +33,30 @@ class InputManager:
         self.state = InputState()
 
     def begin_frame(self) -> None:
-        self.state.pressed.clear()
-        self.state.released.clear()
+        self.state.pressed[:] = _ZEROS
+        self.state.released[:] = _ZEROS
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
-            self.state.pressed[event.key] = True
-            self.state.down[event.key] = True
+            index = _key_index(event.key)
+            self.state.pressed[index] = 1
+            self.state.down[index] = 1
         elif event.type == pygame.KEYUP:
-            self.state.released[event.key] = True
-            self.state.down[event.key] = False
+            index = _key_index(event.key)
+            self.state.released[index] = 1
+            self.state.down[index] = 0
         elif event.type == pygame.MOUSEBUTTONDOWN:
-            self.state.pressed[event.button] = True
-            self.state.down[event.button] = True
+            self.state.pressed[event.button] = 1
+            self.state.down[event.button] = 1
         elif event.type == pygame.MOUSEBUTTONUP:
-            self.state.released[event.button] = True
-            self.state.down[event.button] = False
+            self.state.released[event.button] = 1
+            self.state.down[event.button] = 0
 
     def is_down(self, key: int) -> bool:
-        return self.state.down.get(key, False)
+        return bool(self.state.down[_key_index(key)])
 
     def was_pressed(self, key: int) -> bool:
-        return self.state.pressed.get(key, False)
+        return bool(self.state.pressed[_key_index(key)])
 
     def was_released(self, key: int) -> bool:
-        return self.state.released.get(key, False)
+        return bool(self.state.released[_key_index(key)])
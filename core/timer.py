@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from typing import Callable, List
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduledCall:
     """Container for a scheduled callback."""
 
@@ -22,14 +22,20 @@ class Timer:
     calls: List[ScheduledCall] = field(default_factory=list)
 
     def update(self, dt: float) -> None:
-        for call in list(self.calls):
+        # Single forward pass rebuilding the list; list.remove would rescan
+        # from the front for every expired call. Callbacks that schedule new
+        # calls append to the fresh list and are not ticked until next update.
+        pending = self.calls
+        self.calls = remaining = []
+        for call in pending:
             call.delay -= dt
             if call.delay <= 0:
                 call.callback()
                 if call.repeat and call.interval is not None:
                     call.delay += call.interval
-                else:
-                    self.calls.remove(call)
+                    remaining.append(call)
+            else:
+                remaining.append(call)
 
     def after(self, delay: float, callback: Callable[[], None]) -> None:
         self.calls.append(ScheduledCall(delay=delay, callback=callback))
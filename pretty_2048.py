@@ -5,6 +5,7 @@ from __future__ import annotations
 import random
 import tkinter as tk
 import tkinter.font as tkfont
+from array import array
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
@@ -38,6 +39,21 @@ BEYOND_COLOR = ("#3c3a32", "#f9f6f2")
 BACKGROUND_COLOR = "#bbada0"
 BOARD_BACKGROUND = "#cdc1b4"
 
+# Ready-made itemconfigure kwargs per tile value, including the stringified
+# text, so update_style hands each canvas call a prebuilt dict. Values past
+# 2048 are added lazily the first time they appear.
+_RECT_STYLE: Dict[int, Dict[str, str]] = {v: {"fill": bg} for v, (bg, _fg) in TILE_COLORS.items()}
+_TEXT_STYLE: Dict[int, Dict[str, str]] = {v: {"text": str(v), "fill": fg} for v, (_bg, fg) in TILE_COLORS.items()}
+
+# Per-direction traversal orders, built once. Each entry is the board lines
+# in merge order: tiles slide toward a line's first coordinate.
+_LINES: Dict[str, Tuple[Tuple[Tuple[int, int], ...], ...]] = {
+    "left": tuple(tuple((r, c) for c in range(BOARD_SIZE)) for r in range(BOARD_SIZE)),
+    "right": tuple(tuple((r, c) for c in reversed(range(BOARD_SIZE))) for r in range(BOARD_SIZE)),
+    "up": tuple(tuple((r, c) for r in range(BOARD_SIZE)) for c in range(BOARD_SIZE)),
+    "down": tuple(tuple((r, c) for r in reversed(range(BOARD_SIZE))) for c in range(BOARD_SIZE)),
+}
+
 
 @dataclass
 class TileWidget:
@@ -49,8 +65,16 @@ class TileWidget:
     font_map: Dict[str, tkfont.Font]
 
     def __post_init__(self) -> None:
-        self.rect = self.canvas.create_rectangle(0, 0, 0, 0, width=0, tags=("tile", f"tile-{self.tile_id}"))
-        self.text = self.canvas.create_text(0, 0, tags=("tile-text", f"tile-text-{self.tile_id}"))
+        # A tag shared by the rectangle and text lets move_by shift both
+        # items with a single Tcl command.
+        self.group_tag = f"tilegrp-{self.tile_id}"
+        self._prev_row = self.row
+        self._prev_col = self.col
+        self._font_key: Optional[str] = None
+        self.rect = self.canvas.create_rectangle(
+            0, 0, 0, 0, width=0, tags=("tile", f"tile-{self.tile_id}", self.group_tag)
+        )
+        self.text = self.canvas.create_text(0, 0, tags=("tile-text", f"tile-text-{self.tile_id}", self.group_tag))
         self.update_position(self.row, self.col)
         self.update_style()
 
@@ -67,28 +91,29 @@ class TileWidget:
         self.canvas.coords(self.text, x + TILE_SIZE / 2, y + TILE_SIZE / 2)
 
     def move_by(self, dx: float, dy: float) -> None:
-        self.canvas.move(self.rect, dx, dy)
-        self.canvas.move(self.text, dx, dy)
+        self.canvas.move(self.group_tag, dx, dy)
 
     def update_style(self) -> None:
-        fg_bg = TILE_COLORS.get(self.value, BEYOND_COLOR)
-        bg_color, fg_color = fg_bg
-        self.canvas.itemconfigure(self.rect, fill=bg_color)
-        font = self._font_for_value(self.value)
-        self.canvas.itemconfigure(self.text, text=str(self.value), fill=fg_color, font=font)
+        value = self.value
+        rect_style = _RECT_STYLE.get(value)
+        if rect_style is None:
+            bg_color, fg_color = BEYOND_COLOR
+            rect_style = _RECT_STYLE[value] = {"fill": bg_color}
+            _TEXT_STYLE[value] = {"text": str(value), "fill": fg_color}
+        self.canvas.itemconfigure(self.rect, **rect_style)
+        # Font size only changes when the digit count crosses 100/1000, so
+        # skip the font kwarg (an extra Tcl option) when it is unchanged.
+        font_key = "large" if value < 100 else "medium" if value < 1000 else "small"
+        if font_key != self._font_key:
+            self._font_key = font_key
+            self.canvas.itemconfigure(self.text, font=self.font_map[font_key], **_TEXT_STYLE[value])
+        else:
+            self.canvas.itemconfigure(self.text, **_TEXT_STYLE[value])
 
     def set_value(self, value: int) -> None:
         self.value = value
         self.update_style()
 
-    def _font_for_value(self, value: int) -> tkfont.Font:
-        digits = len(str(value))
-        if digits <= 2:
-            return self.font_map["large"]
-        if digits == 3:
-            return self.font_map["medium"]
-        return self.font_map["small"]
-
     def destroy(self) -> None:
         self.canvas.delete(self.rect)
         self.canvas.delete(self.text)
@@ -104,13 +129,22 @@ class Game2048App:
         height = width + 120
         self.root.geometry(f"{width}x{height}")
 
+        # One Font object per role; each tkfont.Font() is a Tcl round-trip
+        # and the two score boxes would otherwise duplicate theirs.
+        self.ui_fonts = {
+            "title": tkfont.Font(size=28, weight="bold"),
+            "message": tkfont.Font(size=12),
+            "score_label": tkfont.Font(size=12, weight="bold"),
+            "score_value": tkfont.Font(size=18, weight="bold"),
+        }
+
         self.header = tk.Frame(root, bg=BACKGROUND_COLOR)
         self.header.pack(fill=tk.X)
 
         self.title_label = tk.Label(
             self.header,
             text="2048",
-            font=tkfont.Font(size=28, weight="bold"),
+            font=self.ui_fonts["title"],
             bg=BACKGROUND_COLOR,
             fg="#f9f6f2",
         )
@@ -127,7 +161,7 @@ class Game2048App:
         self.message_label = tk.Label(
             root,
             textvariable=self.message_var,
-            font=tkfont.Font(size=12),
+            font=self.ui_fonts["message"],
             bg=BACKGROUND_COLOR,
             fg="#f9f6f2",
         )
@@ -150,23 +184,33 @@ class Game2048App:
 
         self._draw_board_background()
 
-        self.board: List[List[Optional[TileWidget]]] = [[None] * BOARD_SIZE for _ in range(BOARD_SIZE)]
+        # Flat array of tile IDs (0 = empty); cell (r, c) lives at r*4+c.
+        # One contiguous buffer of shorts instead of nested lists of widget
+        # references keeps the move/scan loops on integer compares.
+        self.board = array("h", [0] * (BOARD_SIZE * BOARD_SIZE))
+        self._empty_cells: List[int] = list(range(BOARD_SIZE * BOARD_SIZE))
+        self._empty_index: Dict[int, int] = {i: i for i in self._empty_cells}
+        self._moves_available: Optional[bool] = True
+        # Scratch buffer reused by compute_move for each line's result.
+        self._scratch_line: List[Optional[TileWidget]] = [None] * BOARD_SIZE
         self.tiles: Dict[int, TileWidget] = {}
         self.tile_id_counter = 0
+        self._max_tile = 0
         self.score = 0
         self.best_score = 0
+        self._last_score_str = ""
+        self._last_best_str = ""
 
         self.animating = False
         self.animation_state: Optional[Dict[str, object]] = None
-        self.start_positions: Dict[int, Tuple[int, int]] = {}
 
         self.reset_game()
         self.root.bind("<Key>", self.on_key)
 
     def _build_score_box(self, label: str, value_var: tk.StringVar) -> tk.Frame:
         frame = tk.Frame(self.header, bg="#bbada0", padx=18, pady=10)
-        tk.Label(frame, text=label, font=tkfont.Font(size=12, weight="bold"), bg="#bbada0", fg="#eee4da").pack()
-        tk.Label(frame, textvariable=value_var, font=tkfont.Font(size=18, weight="bold"), bg="#bbada0", fg="#ffffff").pack()
+        tk.Label(frame, text=label, font=self.ui_fonts["score_label"], bg="#bbada0", fg="#eee4da").pack()
+        tk.Label(frame, textvariable=value_var, font=self.ui_fonts["score_value"], bg="#bbada0", fg="#ffffff").pack()
         return frame
 
     def _draw_board_background(self) -> None:
@@ -199,11 +243,14 @@ class Game2048App:
     def reset_game(self) -> None:
         self.animating = False
         self.animation_state = None
-        self.start_positions = {}
         self.clear_tiles()
-        self.board = [[None] * BOARD_SIZE for _ in range(BOARD_SIZE)]
+        self.board = array("h", [0] * (BOARD_SIZE * BOARD_SIZE))
+        self._empty_cells = list(range(BOARD_SIZE * BOARD_SIZE))
+        self._empty_index = {i: i for i in self._empty_cells}
+        self._moves_available = True
         self.tiles = {}
         self.tile_id_counter = 0
+        self._max_tile = 0
         self.score = 0
         self.update_score_boxes()
         self.message_var.set("Use arrow keys or WASD to play")
@@ -237,7 +284,6 @@ class Game2048App:
         self.queue_move(direction)
 
     def queue_move(self, direction: str) -> None:
-        self.start_positions = {tile_id: (tile.row, tile.col) for tile_id, tile in self.tiles.items()}
         moved, movements, merges, _ = self.compute_move(direction)
         if not moved:
             return
@@ -252,29 +298,16 @@ class Game2048App:
         merges: List[Tuple[int, int]] = []
         score_gain = 0
 
-        def line_iterator() -> List[List[Tuple[int, int]]]:
-            lines: List[List[Tuple[int, int]]] = []
-            if direction == "left":
-                for r in range(BOARD_SIZE):
-                    lines.append([(r, c) for c in range(BOARD_SIZE)])
-            elif direction == "right":
-                for r in range(BOARD_SIZE):
-                    lines.append([(r, c) for c in reversed(range(BOARD_SIZE))])
-            elif direction == "up":
-                for c in range(BOARD_SIZE):
-                    lines.append([(r, c) for r in range(BOARD_SIZE)])
-            elif direction == "down":
-                for c in range(BOARD_SIZE):
-                    lines.append([(r, c) for r in reversed(range(BOARD_SIZE))])
-            return lines
-
         moved = False
-        lines = line_iterator()
-        for coords in lines:
-            tiles_line = [self.board[r][c] for r, c in coords if self.board[r][c] is not None]
+        board = self.board
+        tiles = self.tiles
+        for coords in _LINES[direction]:
+            tiles_line = [tiles[tile_id] for tile_id in (board[r * BOARD_SIZE + c] for r, c in coords) if tile_id]
             if not tiles_line:
                 continue
-            new_line: List[Optional[TileWidget]] = [None] * BOARD_SIZE
+            new_line = self._scratch_line
+            for i in range(BOARD_SIZE):
+                new_line[i] = None
             target_index = 0
             idx = 0
             while idx < len(tiles_line):
@@ -286,6 +319,8 @@ class Game2048App:
                     assert next_tile is not None
                     merges.append((current_tile.tile_id, next_tile.tile_id))
                     current_tile.value *= 2
+                    if current_tile.value > self._max_tile:
+                        self._max_tile = current_tile.value
                     score_gain += current_tile.value
                     movements[current_tile.tile_id] = current_target
                     movements[next_tile.tile_id] = current_target
@@ -297,19 +332,24 @@ class Game2048App:
                     idx += 1
                 target_index += 1
 
-            for fill_index in range(target_index, BOARD_SIZE):
-                new_line[fill_index] = None
-
             for placement_idx, (r, c) in enumerate(coords):
                 tile = new_line[placement_idx]
-                self.board[r][c] = tile
+                index = r * BOARD_SIZE + c
+                new_id = tile.tile_id if tile is not None else 0
+                old_id = board[index]
+                if old_id != new_id:
+                    if old_id == 0:
+                        self._mark_filled(index)
+                    elif new_id == 0:
+                        self._mark_empty(index)
+                    board[index] = new_id
 
         for tile_id, (target_row, target_col) in movements.items():
             tile = self.tiles.get(tile_id)
             if tile is None:
                 continue
-            start = self.start_positions.get(tile_id, (tile.row, tile.col))
-            if start != (target_row, target_col):
+            tile._prev_row, tile._prev_col = tile.row, tile.col
+            if (tile.row, tile.col) != (target_row, target_col):
                 moved = True
             tile.row = target_row
             tile.col = target_col
@@ -318,11 +358,15 @@ class Game2048App:
             moved = True
 
         if moved:
+            # A board with several empty cells always has a legal move, so
+            # only a near-full board forces moves_available to rescan.
+            self._moves_available = True if len(self._empty_cells) > 2 else None
             self.score += score_gain
             if self.score > self.best_score:
                 self.best_score = self.score
-            self.update_score_boxes()
-            if any(tile.value >= WIN_TILE for tile in self.tiles.values()):
+            # The score boxes refresh once at animation completion; pushing
+            # them here too would redraw the labels twice per move.
+            if self._max_tile >= WIN_TILE:
                 self.message_var.set("You made a 2048 tile! Keep going!")
 
         return moved, movements, merges, score_gain
@@ -335,8 +379,7 @@ class Game2048App:
             tile = self.tiles.get(tile_id)
             if tile is None:
                 continue
-            start_row, start_col = self.start_positions.get(tile_id, (target_row, target_col))
-            start_x, start_y = tile.grid_to_pixel(start_row, start_col)
+            start_x, start_y = tile.grid_to_pixel(tile._prev_row, tile._prev_col)
             end_x, end_y = tile.grid_to_pixel(target_row, target_col)
             dx = (end_x - start_x) / ANIMATION_STEPS
             dy = (end_y - start_y) / ANIMATION_STEPS
@@ -390,21 +433,40 @@ class Game2048App:
         self.add_random_tile(animate=True)
         if not self.moves_available():
             self.message_var.set("No more moves! Press R to restart.")
-        elif any(tile.value >= WIN_TILE for tile in self.tiles.values()):
+        elif self._max_tile >= WIN_TILE:
             self.message_var.set("You made a 2048 tile! Keep going!")
         else:
             self.message_var.set("Use arrow keys or WASD to play")
 
+    def _mark_empty(self, index: int) -> None:
+        self._empty_index[index] = len(self._empty_cells)
+        self._empty_cells.append(index)
+
+    def _mark_filled(self, index: int) -> None:
+        # Swap-with-last-and-pop keeps deletion O(1) without disturbing
+        # the positions of other cached cells.
+        slot = self._empty_index.pop(index)
+        last = self._empty_cells.pop()
+        if last != index:
+            self._empty_cells[slot] = last
+            self._empty_index[last] = slot
+
     def add_random_tile(self, animate: bool) -> None:
-        empties = [(r, c) for r in range(BOARD_SIZE) for c in range(BOARD_SIZE) if self.board[r][c] is None]
+        board = self.board
+        empties = self._empty_cells
         if not empties:
             return
-        row, col = random.choice(empties)
+        index = empties[random.randrange(len(empties))]
+        self._mark_filled(index)
+        row, col = divmod(index, BOARD_SIZE)
         value = 4 if random.random() < 0.1 else 2
+        if value > self._max_tile:
+            self._max_tile = value
         self.tile_id_counter += 1
         tile = TileWidget(self.tile_id_counter, value, row, col, self.canvas, self.font_map)
         self.tiles[tile.tile_id] = tile
-        self.board[row][col] = tile
+        board[index] = tile.tile_id
+        self._moves_available = True if len(empties) > 2 else None
         tile.update_style()
         if animate:
             self.animate_new_tile(tile, step=0)
@@ -425,23 +487,41 @@ class Game2048App:
             tile.update_position(tile.row, tile.col)
 
     def moves_available(self) -> bool:
+        if self._moves_available is None:
+            self._moves_available = self._scan_moves_available()
+        return self._moves_available
+
+    def _scan_moves_available(self) -> bool:
+        if self._empty_cells:
+            return True
+        board = self.board
+        tiles = self.tiles
         for row in range(BOARD_SIZE):
             for col in range(BOARD_SIZE):
-                tile = self.board[row][col]
-                if tile is None:
+                tile_id = board[row * BOARD_SIZE + col]
+                if tile_id == 0:
                     return True
+                value = tiles[tile_id].value
                 for dr, dc in ((0, 1), (1, 0)):
                     nr, nc = row + dr, col + dc
                     if nr < BOARD_SIZE and nc < BOARD_SIZE:
-                        neighbor = self.board[nr][nc]
-                        if neighbor is None or neighbor.value == tile.value:
+                        neighbor_id = board[nr * BOARD_SIZE + nc]
+                        if neighbor_id == 0 or tiles[neighbor_id].value == value:
                             return True
         return False
 
     def update_score_boxes(self) -> None:
-        self.score_var.set(str(self.score))
+        # Each StringVar.set fires a trace and relayouts its label, so skip
+        # writes whose value matches what the label already shows.
+        score_str = str(self.score)
+        if score_str != self._last_score_str:
+            self._last_score_str = score_str
+            self.score_var.set(score_str)
         self.best_score = max(self.best_score, self.score)
-        self.best_var.set(str(self.best_score))
+        best_str = str(self.best_score)
+        if best_str != self._last_best_str:
+            self._last_best_str = best_str
+            self.best_var.set(best_str)
 
     def run(self) -> None:
         self.root.mainloop()
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Dict
+from typing import Callable, Dict, FrozenSet, Optional, Set
 
 
 @dataclass
@@ -11,6 +11,7 @@ class Achievement:
     name: str
     description: str
     condition: Callable[[dict], bool]
+    watched_keys: FrozenSet[str]
 
 
 ACHIEVEMENTS: Dict[str, Achievement] = {
@@ -19,24 +20,36 @@ ACHIEVEMENTS: Dict[str, Achievement] = {
         "No-Miss 50",
         "Finish a stage with 50 consecutive hits.",
         lambda stats: stats.get("best_combo", 0) >= 50,
+        frozenset({"best_combo"}),
     ),
     "pacifist_rescue": Achievement(
         "pacifist_rescue",
         "Pacifist Rescue",
         "Save all civilians in a stage without shooting them.",
         lambda stats: stats.get("hostages_saved", 0) > 0 and stats.get("hostages_lost", 0) == 0,
+        frozenset({"hostages_saved", "hostages_lost"}),
     ),
     "explosive_expert": Achievement(
         "explosive_expert",
         "Explosive Expert",
         "Defeat three enemies with barrels in one stage.",
         lambda stats: stats.get("barrel_multi_kill", 0) >= 3,
+        frozenset({"barrel_multi_kill"}),
     ),
 }
 
 
-def evaluate_achievements(save_data, stats: dict) -> None:
-    """Check and unlock achievements based on ``stats``."""
+def evaluate_achievements(save_data, stats: dict, changed_keys: Optional[Set[str]] = None) -> None:
+    """Check and unlock achievements based on ``stats``.
+
+    Already-unlocked achievements are skipped without running their
+    condition. When ``changed_keys`` is given, only achievements watching
+    one of those stat keys are evaluated.
+    """
     for achievement in ACHIEVEMENTS.values():
+        if save_data.achievement_unlocked(achievement.id):
+            continue
+        if changed_keys is not None and not (achievement.watched_keys & changed_keys):
+            continue
         if achievement.condition(stats):
             save_data.unlock_achievement(achievement.id)
@@ -24,9 +24,10 @@ class AudioSystem:
             self.sfx[name].set_volume(self.master_volume)
 
     def play_sfx(self, name: str) -> None:
+        # Volume is applied at load time and by set_master_volume, so the
+        # play path stays a single mixer call.
         sound = self.sfx.get(name)
         if sound:
-            sound.set_volume(self.master_volume)
             sound.play()
 
     def load_music(self, name: str, filename: str) -> None:
@@ -1,23 +1,103 @@
 """Collision helpers for hit-scan checks."""
 from __future__ import annotations
 
-from typing import Iterable, Optional
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, Iterator, List, Optional
 
 import pygame
 
 
-def hitscan(position: pygame.Vector2, actors: Iterable, radius: float = 12.0):
-    """Return the first actor whose rect contains ``position``."""
-    for actor in actors:
-        rect = getattr(actor, "rect", None)
-        if rect and rect.collidepoint(position):
-            return actor
-    return None
+class TargetIndex:
+    """Shoot targets sorted by x so hitscan can binary-search the rail.
 
+    ``slack`` must cover the widest actor's half-width so the searched
+    strip cannot miss a rect whose center lies outside it.
+    """
 
-def rect_list_collide(rect: pygame.Rect, actors: Iterable) -> Optional[object]:
-    for actor in actors:
-        actor_rect = getattr(actor, "rect", None)
-        if actor_rect and rect.colliderect(actor_rect):
-            return actor
-    return None
+    def __init__(self, slack: int = 120) -> None:
+        self.slack = slack
+        self.targets: List = []
+        self.centerxs: List[int] = []
+        self.priority: List[int] = []
+
+    def rebuild(self, targets: Iterable) -> None:
+        targets = list(targets)
+        order = sorted(range(len(targets)), key=lambda i: targets[i].rect.centerx)
+        self.targets = [targets[i] for i in order]
+        self.centerxs = [target.rect.centerx for target in self.targets]
+        self.priority = order
+
+    def pick(self, position) -> Optional[object]:
+        """Return the highest-priority live actor containing ``position``."""
+        lo = bisect_left(self.centerxs, position.x - self.slack)
+        hi = bisect_right(self.centerxs, position.x + self.slack)
+        best = None
+        best_priority = -1
+        for idx in range(lo, hi):
+            actor = self.targets[idx]
+            if actor.alive and actor.rect.collidepoint(position):
+                rank = self.priority[idx]
+                if best is None or rank < best_priority:
+                    best = actor
+                    best_priority = rank
+        return best
+
+
+class SpatialHash:
+    """Uniform grid over actor x-positions for cheap vicinity queries.
+
+    The rail is horizontal, so bucketing on ``rect.centerx`` alone is
+    enough to narrow area-of-effect scans to a handful of actors.
+    """
+
+    def __init__(self, cell_size: int = 120) -> None:
+        self.cell_size = cell_size
+        self.buckets: Dict[int, List] = {}
+
+    def rebuild(self, actors: Iterable) -> None:
+        buckets = self.buckets
+        buckets.clear()
+        cell = self.cell_size
+        for actor in actors:
+            key = actor.rect.centerx // cell
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = [actor]
+            else:
+                bucket.append(actor)
+
+    def query_range(self, x_min: float, x_max: float) -> Iterator:
+        """Yield actors whose bucket overlaps ``[x_min, x_max]``."""
+        cell = self.cell_size
+        buckets = self.buckets
+        for key in range(int(x_min) // cell, int(x_max) // cell + 1):
+            bucket = buckets.get(key)
+            if bucket:
+                yield from bucket
+
+
+def hitscan(position: pygame.Vector2, actors: Iterable, radius: float = 120.0,
+            spatial_hash: Optional[SpatialHash] = None):
+    """Return the first actor whose rect contains ``position``.
+
+    When a :class:`SpatialHash` built over ``actors`` is supplied, only the
+    buckets within ``radius`` of the cursor are scanned; ``radius`` must
+    cover the widest actor's half-width.
+    """
+    if spatial_hash is not None:
+        actors = spatial_hash.query_range(position.x - radius, position.x + radius)
+    actors = list(actors)
+    # One C-level collidelist call instead of a Python loop with a
+    # collidepoint call per actor. A 1x1 probe rect stands in for the point.
+    probe = pygame.Rect(position.x, position.y, 1, 1)
+    index = probe.collidelist([actor.rect for actor in actors])
+    return actors[index] if index >= 0 else None
+
+
+def rect_list_collide(rect: pygame.Rect, actors: Iterable,
+                      spatial_hash: Optional[SpatialHash] = None) -> Optional[object]:
+    if spatial_hash is not None:
+        actors = spatial_hash.query_range(rect.left - spatial_hash.cell_size, rect.right + spatial_hash.cell_size)
+    actors = list(actors)
+    index = rect.collidelist([actor.rect for actor in actors])
+    return actors[index] if index >= 0 else None
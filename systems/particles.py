@@ -1,37 +1,111 @@
 """Basic particle system for hit sparks and muzzle flashes."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List
+from array import array
+from typing import List, Tuple
 
 import pygame
 
 
-@dataclass
-class Particle:
-    position: pygame.Vector2
-    velocity: pygame.Vector2
-    lifetime: float
-    color: tuple[int, int, int]
-    radius: float
+class ParticleSystem:
+    """Particles stored structure-of-arrays style.
 
+    Parallel arrays of packed 32-bit floats replace the old list of
+    Particle objects, so the per-frame update is scalar math with no
+    Vector2 temporaries and a quarter of the memory of boxed floats.
+    """
 
-class ParticleSystem:
     def __init__(self) -> None:
-        self.particles: List[Particle] = []
+        self.count = 0
+        # Prerendered circle sprites keyed by (color, radius); colors and
+        # radii repeat heavily, so most draws hit the cache.
+        self._circle_cache: dict = {}
+        # Blit list recycled across frames instead of reallocated per draw.
+        self._blits: List[tuple] = []
+        self.pos_x = array("f")
+        self.pos_y = array("f")
+        self.vel_x = array("f")
+        self.vel_y = array("f")
+        self.lifetime = array("f")
+        self.color: List[Tuple[int, int, int]] = []
+        # Pixel radius, clamped and truncated once at spawn time.
+        self.radius = array("i")
 
     def spawn(self, position: pygame.Vector2, velocity: pygame.Vector2, lifetime: float, color, radius: float) -> None:
-        self.particles.append(Particle(position, velocity, lifetime, color, radius))
+        self.spawn_xy(position.x, position.y, velocity.x, velocity.y, lifetime, color, radius)
+
+    def spawn_xy(self, x: float, y: float, vx: float, vy: float, lifetime: float, color, radius: float) -> None:
+        """Scalar entry point so hot callers skip Vector2 construction."""
+        self.pos_x.append(x)
+        self.pos_y.append(y)
+        self.vel_x.append(vx)
+        self.vel_y.append(vy)
+        self.lifetime.append(lifetime)
+        self.color.append(color)
+        self.radius.append(max(1, int(radius)))
+        self.count += 1
 
     def update(self, dt: float) -> None:
-        for particle in list(self.particles):
-            particle.lifetime -= dt
-            if particle.lifetime <= 0:
-                self.particles.remove(particle)
+        n = self.count
+        lifetime = self.lifetime
+        pos_x = self.pos_x
+        pos_y = self.pos_y
+        vel_x = self.vel_x
+        vel_y = self.vel_y
+        color = self.color
+        radius = self.radius
+        # Single-pass write-pointer compaction: survivors slide down over
+        # expired slots, so expiry is O(1) per particle with no rebuilds.
+        write = 0
+        for read in range(n):
+            remaining = lifetime[read] - dt
+            if remaining <= 0:
                 continue
-            particle.position += particle.velocity * dt
+            lifetime[write] = remaining
+            pos_x[write] = pos_x[read] + vel_x[read] * dt
+            pos_y[write] = pos_y[read] + vel_y[read] * dt
+            if write != read:
+                vel_x[write] = vel_x[read]
+                vel_y[write] = vel_y[read]
+                color[write] = color[read]
+                radius[write] = radius[read]
+            write += 1
+        if write != n:
+            del lifetime[write:]
+            del pos_x[write:]
+            del pos_y[write:]
+            del vel_x[write:]
+            del vel_y[write:]
+            del color[write:]
+            del radius[write:]
+            self.count = write
+
+    def _circle_sprite(self, color, radius: int) -> pygame.Surface:
+        key = (color, radius)
+        sprite = self._circle_cache.get(key)
+        if sprite is None:
+            size = radius * 2 + 1
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (radius, radius), radius)
+            self._circle_cache[key] = sprite
+        return sprite
 
     def draw(self, surface: pygame.Surface, camera) -> None:
-        for particle in self.particles:
-            pos = camera.world_to_screen(particle.position)
-            pygame.draw.circle(surface, particle.color, (int(pos.x), int(pos.y)), int(max(1, particle.radius)))
+        if not self.count:
+            return
+        # The camera already caches its integer frame offsets; grab them
+        # once instead of re-deriving a float offset per draw.
+        ox, oy = camera.apply_xy(0, 0)
+        pos_x = self.pos_x
+        pos_y = self.pos_y
+        color = self.color
+        radius = self.radius
+        circle_sprite = self._circle_sprite
+        # One batched blits call instead of a draw.circle per particle.
+        blits = self._blits
+        blits.clear()
+        append = blits.append
+        for i in range(self.count):
+            r = radius[i]
+            append((circle_sprite(color[i], r), (int(pos_x[i] + ox) - r, int(pos_y[i] + oy) - r)))
+        surface.blits(blits, doreturn=0)
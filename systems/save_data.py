@@ -1,7 +1,10 @@
 """Save data management."""
 from __future__ import annotations
 
+import copy
+import gzip
 import json
+import zlib
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List
@@ -20,59 +23,86 @@ DEFAULT_SAVE = {
 @dataclass
 class SaveData:
     path: Path
-    data: Dict = field(default_factory=lambda: json.loads(json.dumps(DEFAULT_SAVE)))
+    data: Dict = field(default_factory=lambda: copy.deepcopy(DEFAULT_SAVE))
+    _dirty: bool = field(default=False, init=False, repr=False)
 
     def __post_init__(self) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
         if self.path.exists():
             try:
-                self.data = json.loads(self.path.read_text())
-            except json.JSONDecodeError:
-                self.data = json.loads(json.dumps(DEFAULT_SAVE))
+                raw = self.path.read_bytes()
+                # Saves written before compression landed are plain JSON;
+                # sniff the gzip magic rather than trusting the suffix.
+                if raw[:2] == b"\x1f\x8b":
+                    raw = gzip.decompress(raw)
+                self.data = json.loads(raw)
+            except (OSError, EOFError, zlib.error, json.JSONDecodeError):
+                self.data = copy.deepcopy(DEFAULT_SAVE)
         else:
             self.write()
+        self._bind_views()
+
+    def _bind_views(self) -> None:
+        """Alias the hot sub-dicts so readers skip the nested .get chains."""
+        data = self.data
+        self._weapons = data.setdefault("weapons", {})
+        self._upgrades = data.setdefault("upgrades", {})
+        self._completed_stages = data.setdefault("completed_stages", {})
+        self._achievements = data.setdefault("achievements", {})
+        self._settings = data.setdefault("settings", {})
 
     def write(self) -> None:
-        self.path.write_text(json.dumps(self.data, indent=2))
+        # Write to a sibling temp file and swap it in, so a crash
+        # mid-write can never leave a truncated save behind.
+        tmp = self.path.with_suffix(".tmp")
+        with gzip.open(tmp, "wt", encoding="utf-8", compresslevel=1) as handle:
+            json.dump(self.data, handle, separators=(",", ":"))
+        tmp.replace(self.path)
+        self._dirty = False
+
+    def flush(self, force: bool = False) -> None:
+        """Write pending changes; mutators only mark the data dirty."""
+        if self._dirty or force:
+            self.write()
 
     def add_coins(self, amount: int) -> None:
         self.data["coins"] = self.data.get("coins", 0) + amount
-        self.write()
+        self._dirty = True
 
     def unlock_weapon(self, weapon_id: str) -> None:
-        self.data.setdefault("weapons", {})[weapon_id] = True
-        self.write()
+        self._weapons[weapon_id] = True
+        self._dirty = True
 
     def set_upgrade_level(self, upgrade_id: str, level: int) -> None:
-        self.data.setdefault("upgrades", {})[upgrade_id] = level
-        self.write()
+        self._upgrades[upgrade_id] = level
+        self._dirty = True
 
     def set_stage_result(self, stage_id: str, stars: int, score: int) -> None:
-        self.data.setdefault("completed_stages", {})[stage_id] = {"stars": stars, "score": score}
-        self.write()
+        self._completed_stages[stage_id] = {"stars": stars, "score": score}
+        self._dirty = True
 
     def achievement_unlocked(self, achievement_id: str) -> bool:
-        return self.data.get("achievements", {}).get(achievement_id, False)
+        return self._achievements.get(achievement_id, False)
 
     def unlock_achievement(self, achievement_id: str) -> None:
         if not self.achievement_unlocked(achievement_id):
-            self.data.setdefault("achievements", {})[achievement_id] = True
-            self.write()
+            self._achievements[achievement_id] = True
+            self._dirty = True
 
     def update_settings(self, **kwargs) -> None:
-        settings = self.data.setdefault("settings", {})
-        settings.update(kwargs)
-        self.write()
+        self._settings.update(kwargs)
+        self._dirty = True
 
     def get_completed_stages(self) -> Dict[str, Dict[str, int]]:
-        return self.data.get("completed_stages", {})
+        return self._completed_stages
 
     def get_weapon_unlocks(self) -> Dict[str, bool]:
-        return self.data.get("weapons", {})
+        return self._weapons
 
     def get_upgrade(self, upgrade_id: str) -> int:
-        return self.data.get("upgrades", {}).get(upgrade_id, 0)
+        return self._upgrades.get(upgrade_id, 0)
 
     def reset(self) -> None:
-        self.data = json.loads(json.dumps(DEFAULT_SAVE))
-        self.write()
+        self.data = copy.deepcopy(DEFAULT_SAVE)
+        self._bind_views()
+        self._dirty = True
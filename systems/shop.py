@@ -18,12 +18,41 @@ class ShopState(Scene):
         self.upgrades = self._load_json("upgrades.json")
         self.selection_index = 0
         self.items = self.weapons + self.upgrades
+        self._build_render_cache()
+        # The shop only changes on input, so the composed frame is cached
+        # and redrawn just when the dirty flag is raised.
+        self._frame_cache: pygame.Surface | None = None
+        self._dirty = True
 
     def _load_json(self, filename: str) -> List[Dict]:
         path = self.game.base_path / "data" / filename
-        if path.exists():
-            return json.loads(path.read_text())
-        return []
+        cache = self.game._json_cache
+        data = cache.get(path)
+        if data is None:
+            data = json.loads(path.read_bytes()) if path.exists() else []
+            cache[path] = data
+        return data
+
+    def _item_owned(self, item: Dict) -> bool:
+        if item.get("type") == "weapon":
+            return self.game.save.get_weapon_unlocks().get(item["id"], False)
+        return self.game.save.get_upgrade(item["id"]) > 0
+
+    def _build_render_cache(self) -> None:
+        """Render item labels once; ownership only changes on purchase."""
+        font = self.font
+        self._title_surface = self.font_title.render("Shop", True, (255, 220, 160))
+        self._empty_surface = font.render("No items available", True, (200, 200, 200))
+        self._rendered = []
+        for item in self.items:
+            label = f"{item['name']} - {item['cost']} coins"
+            if self._item_owned(item):
+                label += " (Owned)"
+            self._rendered.append((
+                font.render(label, True, (255, 255, 255)),
+                font.render(label, True, (160, 160, 170)),
+                font.render(item.get("description", ""), True, (120, 140, 160)),
+            ))
 
     def handle_event(self, event) -> None:
         if event.type == pygame.KEYDOWN:
@@ -31,8 +60,10 @@ class ShopState(Scene):
                 self.game.scene_manager.pop()
             elif event.key in (pygame.K_DOWN, pygame.K_s):
                 self.selection_index = (self.selection_index + 1) % len(self.items)
+                self._dirty = True
             elif event.key in (pygame.K_UP, pygame.K_w):
                 self.selection_index = (self.selection_index - 1) % len(self.items)
+                self._dirty = True
             elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
                 self._purchase_selected()
 
@@ -47,35 +78,36 @@ class ShopState(Scene):
             if not self.game.save.get_weapon_unlocks().get(item["id"], False):
                 self.game.save.add_coins(-cost)
                 self.game.save.unlock_weapon(item["id"])
+                self._build_render_cache()
+                self._dirty = True
         else:
             level = self.game.save.get_upgrade(item["id"])
             self.game.save.add_coins(-cost)
             self.game.save.set_upgrade_level(item["id"], level + 1)
+            self._build_render_cache()
+            self._dirty = True
 
     def update(self, dt: float) -> None:
         pass
 
     def draw(self, surface) -> None:
+        cache = self._frame_cache
+        if self._dirty or cache is None or cache.get_size() != surface.get_size():
+            if cache is None or cache.get_size() != surface.get_size():
+                cache = self._frame_cache = pygame.Surface(surface.get_size())
+            self._render_frame(cache)
+            self._dirty = False
+        surface.blit(cache, (0, 0))
+
+    def _render_frame(self, surface: pygame.Surface) -> None:
         surface.fill((26, 26, 30))
-        title = self.font_title.render("Shop", True, (255, 220, 160))
-        surface.blit(title, (60, 60))
+        surface.blit(self._title_surface, (60, 60))
         coins = self.font.render(f"Coins: {self.game.save.data.get('coins', 0)}", True, (220, 220, 220))
         surface.blit(coins, (surface.get_width() - coins.get_width() - 60, 60))
         if not self.items:
-            empty = self.font.render("No items available", True, (200, 200, 200))
-            surface.blit(empty, (60, 160))
+            surface.blit(self._empty_surface, (60, 160))
             return
-        for idx, item in enumerate(self.items):
-            color = (255, 255, 255) if idx == self.selection_index else (160, 160, 170)
-            owned = False
-            if item.get("type") == "weapon":
-                owned = self.game.save.get_weapon_unlocks().get(item["id"], False)
-            else:
-                owned = self.game.save.get_upgrade(item["id"]) > 0
-            label = f"{item['name']} - {item['cost']} coins"
-            if owned:
-                label += " (Owned)"
-            text = self.font.render(label, True, color)
-            surface.blit(text, (60, 160 + idx * 40))
-            desc = self.font.render(item.get("description", ""), True, (120, 140, 160))
+        selection_index = self.selection_index
+        for idx, (selected, idle, desc) in enumerate(self._rendered):
+            surface.blit(selected if idx == selection_index else idle, (60, 160 + idx * 40))
             surface.blit(desc, (80, 190 + idx * 40))
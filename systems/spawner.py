@@ -1,36 +1,47 @@
 """Handles spawning actors based on stage scripts."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Callable, Dict, Iterable, List
+from array import array
+from typing import Callable, Dict, List
 
 from systems.stage_script import StageScript, TimelineEvent
 
 
-@dataclass
-class SpawnInstruction:
-    event: TimelineEvent
-    executed: bool = False
-
-
 class Spawner:
     """Consumes :class:`StageScript` timeline events and spawns actors."""
 
     def __init__(self, script: StageScript, spawn_handlers: Dict[str, Callable[[TimelineEvent], None]]) -> None:
-        self.events: List[SpawnInstruction] = [SpawnInstruction(event) for event in script.iter_events()]
+        # Events sorted by time plus a cursor: each tick only looks at the
+        # events whose time has arrived instead of rescanning the timeline.
+        self.events: List[TimelineEvent] = sorted(script.iter_events(), key=lambda event: event.time)
         self.handlers = spawn_handlers
+        # Actions never change after construction, so resolve each event's
+        # handler once here instead of a dict lookup per fired event. Times
+        # live in their own flat array so the due-check never touches the
+        # event objects.
+        self._times = array("d", (event.time for event in self.events))
+        self._plan: List[tuple] = [
+            (spawn_handlers.get(event.action), event) for event in self.events
+        ]
         self.elapsed = 0.0
+        self._next_index = 0
 
     def reset(self) -> None:
-        for event in self.events:
-            event.executed = False
         self.elapsed = 0.0
+        self._next_index = 0
 
     def update(self, dt: float) -> None:
         self.elapsed += dt
-        for instruction in self.events:
-            if not instruction.executed and self.elapsed >= instruction.event.time:
-                handler = self.handlers.get(instruction.event.action)
-                if handler:
-                    handler(instruction.event)
-                instruction.executed = True
+        times = self._times
+        index = self._next_index
+        count = len(times)
+        # A finished timeline stays finished until reset rewinds the cursor.
+        if index >= count:
+            return
+        plan = self._plan
+        while index < count and self.elapsed >= times[index]:
+            handler, event = plan[index]
+            if handler is not None:
+                handler(event)
+            index += 1
+        self._next_index = index
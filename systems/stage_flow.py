@@ -1,7 +1,14 @@
 """Game states related to stages and menus."""
 from __future__ import annotations
 
-import json
+try:  # orjson parses straight from bytes and is several times faster
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, List, Optional
 
 import pygame
@@ -14,6 +21,7 @@ from actors.player import Player, WEAPON_DATA
 from actors.powerup import Powerup
 from core.scene_manager import Scene
 from systems.achievements import ACHIEVEMENTS, evaluate_achievements
+from systems.collision import SpatialHash, TargetIndex
 from systems.particles import ParticleSystem
 from systems.spawner import Spawner
 from systems.stage_script import StageScript
@@ -24,6 +32,21 @@ BUTTON_LEFT = 1
 BUTTON_RIGHT = 3
 
 
+def _render_cached(cache: dict, font, text: str, color) -> pygame.Surface:
+    """Render ``text`` once per (text, color, font) and reuse the surface.
+
+    Menu draw methods run every frame but their strings barely change;
+    only a selection flip introduces a new cache entry.
+    """
+    key = (text, color, id(font))
+    surface = cache.get(key)
+    if surface is None:
+        # Converting once at insert keeps every later blit on the fast
+        # same-format path.
+        surface = cache[key] = font.render(text, True, color).convert_alpha()
+    return surface
+
+
 class MainMenuState(Scene):
     def __init__(self, game) -> None:
         self.game = game
@@ -31,6 +54,7 @@ class MainMenuState(Scene):
         self.font = game.fonts.get("arial", 32)
         self.options = ["Play", "Shop", "Achievements", "Settings", "Quit"]
         self.selection = 0
+        self._text_cache: dict = {}
 
     def enter(self) -> None:
         self.game.audio.play_music("menu", loop=True)
@@ -62,11 +86,12 @@ class MainMenuState(Scene):
 
     def draw(self, surface) -> None:
         surface.fill((18, 22, 30))
-        title = self.font_title.render("Railshot Heroes", True, (255, 220, 120))
+        cache = self._text_cache
+        title = _render_cached(cache, self.font_title, "Railshot Heroes", (255, 220, 120))
         surface.blit(title, (surface.get_width() // 2 - title.get_width() // 2, 160))
         for idx, option in enumerate(self.options):
             color = (255, 255, 255) if idx == self.selection else (140, 140, 160)
-            text = self.font.render(option, True, color)
+            text = _render_cached(cache, self.font, option, color)
             surface.blit(text, (surface.get_width() // 2 - text.get_width() // 2, 300 + idx * 60))
 
 
@@ -78,6 +103,7 @@ class SettingsState(Scene):
         self.music_slider = game.save.data["settings"].get("music_volume", 0.5)
         self.difficulty = game.save.data["settings"].get("difficulty", "Normal")
         self.difficulties = ["Easy", "Normal", "Hard"]
+        self._text_cache: dict = {}
 
     def handle_event(self, event) -> None:
         if event.type == pygame.KEYDOWN:
@@ -103,15 +129,17 @@ class SettingsState(Scene):
 
     def draw(self, surface) -> None:
         surface.fill((20, 24, 28))
-        title = self.font.render("Settings", True, (255, 220, 120))
+        cache = self._text_cache
+        font = self.font
+        title = _render_cached(cache, font, "Settings", (255, 220, 120))
         surface.blit(title, (60, 80))
-        volume = self.font.render(f"SFX Volume: {self.slider:.1f} (Left/Right)", True, (220, 220, 220))
+        volume = _render_cached(cache, font, f"SFX Volume: {self.slider:.1f} (Left/Right)", (220, 220, 220))
         surface.blit(volume, (60, 160))
-        music = self.font.render(f"Music Volume: {self.music_slider:.1f} (Up/Down)", True, (220, 220, 220))
+        music = _render_cached(cache, font, f"Music Volume: {self.music_slider:.1f} (Up/Down)", (220, 220, 220))
         surface.blit(music, (60, 220))
-        difficulty = self.font.render(f"Difficulty: {self.difficulty} (Tab)", True, (220, 220, 220))
+        difficulty = _render_cached(cache, font, f"Difficulty: {self.difficulty} (Tab)", (220, 220, 220))
         surface.blit(difficulty, (60, 280))
-        hint = self.font.render("Esc to return", True, (160, 160, 160))
+        hint = _render_cached(cache, font, "Esc to return", (160, 160, 160))
         surface.blit(hint, (60, surface.get_height() - 80))
 
 
@@ -120,6 +148,7 @@ class AchievementState(Scene):
         self.game = game
         self.font_title = game.fonts.get("arial", 48)
         self.font = game.fonts.get("arial", 28)
+        self._text_cache: dict = {}
 
     def handle_event(self, event) -> None:
         if event.type == pygame.KEYDOWN and event.key in (pygame.K_ESCAPE, pygame.K_BACKSPACE):
@@ -130,13 +159,14 @@ class AchievementState(Scene):
 
     def draw(self, surface) -> None:
         surface.fill((16, 18, 26))
-        title = self.font_title.render("Achievements", True, (255, 220, 160))
+        cache = self._text_cache
+        title = _render_cached(cache, self.font_title, "Achievements", (255, 220, 160))
         surface.blit(title, (surface.get_width() // 2 - title.get_width() // 2, 80))
         achievements = self.game.save.data.get("achievements", {})
         for idx, achievement in enumerate(ACHIEVEMENTS.values()):
             unlocked = achievements.get(achievement.id, False)
             color = (200, 240, 200) if unlocked else (120, 120, 120)
-            text = self.font.render(f"{achievement.name} - {achievement.description}", True, color)
+            text = _render_cached(cache, self.font, f"{achievement.name} - {achievement.description}", color)
             surface.blit(text, (80, 180 + idx * 40))
 
 
@@ -148,11 +178,23 @@ class StageSelectState(Scene):
         self.stages = self._load_stage_list()
         self.selected_zone = "City"
         self.selected_stage_index = 0
+        self._text_cache: dict = {}
+        # The zone set is fixed after load; derive the key order once and
+        # keep the current zone's stage list resolved instead of a dict
+        # lookup per frame.
+        self._zone_keys = tuple(self.stages)
+        self._zone_stages = self.stages.get(self.selected_zone, [])
+        self._completed = game.save.get_completed_stages()
+
+    def enter(self) -> None:
+        # Results only change while a stage scene is active, and coming
+        # back from one always re-enters this scene.
+        self._completed = self.game.save.get_completed_stages()
 
     def _load_stage_list(self) -> Dict[str, List[dict]]:
         data_path = self.game.base_path / "data" / "stages.json"
         if data_path.exists():
-            return json.loads(data_path.read_text())
+            return _loads(data_path.read_bytes())
         return {"City": []}
 
     def handle_event(self, event) -> None:
@@ -160,19 +202,20 @@ class StageSelectState(Scene):
             if event.key in (pygame.K_ESCAPE, pygame.K_BACKSPACE):
                 self.game.open_main_menu()
             elif event.key == pygame.K_TAB:
-                zones = list(self.stages.keys())
+                zones = self._zone_keys
                 idx = zones.index(self.selected_zone)
                 self.selected_zone = zones[(idx + 1) % len(zones)]
                 self.selected_stage_index = 0
+                self._zone_stages = self.stages.get(self.selected_zone, [])
             elif event.key in (pygame.K_DOWN, pygame.K_s):
-                self.selected_stage_index = min(self.selected_stage_index + 1, len(self.stages[self.selected_zone]) - 1)
+                self.selected_stage_index = min(self.selected_stage_index + 1, len(self._zone_stages) - 1)
             elif event.key in (pygame.K_UP, pygame.K_w):
                 self.selected_stage_index = max(self.selected_stage_index - 1, 0)
             elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
                 self._start_selected_stage()
 
     def _start_selected_stage(self) -> None:
-        zone_stages = self.stages.get(self.selected_zone, [])
+        zone_stages = self._zone_stages
         if zone_stages:
             stage = zone_stages[self.selected_stage_index]
             self.game.open_stage(stage["id"])
@@ -182,18 +225,19 @@ class StageSelectState(Scene):
 
     def draw(self, surface) -> None:
         surface.fill((18, 20, 30))
-        title = self.title_font.render(f"{self.selected_zone} Stages", True, (255, 220, 160))
+        cache = self._text_cache
+        title = _render_cached(cache, self.title_font, f"{self.selected_zone} Stages", (255, 220, 160))
         surface.blit(title, (60, 80))
-        zone_stages = self.stages.get(self.selected_zone, [])
-        completed = self.game.save.get_completed_stages()
+        zone_stages = self._zone_stages
+        completed = self._completed
         for idx, stage in enumerate(zone_stages):
             color = (255, 255, 255) if idx == self.selected_stage_index else (160, 160, 180)
-            entry = self.font.render(f"{stage['name']} ({stage['id']})", True, color)
+            entry = _render_cached(cache, self.font, f"{stage['name']} ({stage['id']})", color)
             surface.blit(entry, (80, 180 + idx * 36))
             result = completed.get(stage["id"])
             if result:
                 stars = "★" * result.get("stars", 0)
-                star_text = self.font.render(stars, True, (255, 220, 80))
+                star_text = _render_cached(cache, self.font, stars, (255, 220, 80))
                 surface.blit(star_text, (480, 180 + idx * 36))
 
 
@@ -204,6 +248,8 @@ class PauseState(Scene):
         self.font = game.fonts.get("arial", 42)
         self.options = ["Resume", "Restart", "Stage Select", "Settings"]
         self.selection = 0
+        self._text_cache: dict = {}
+        self._overlay: Optional[pygame.Surface] = None
 
     def handle_event(self, event) -> None:
         if event.type == pygame.KEYDOWN:
@@ -232,63 +278,91 @@ class PauseState(Scene):
 
     def draw(self, surface) -> None:
         self.stage_state.draw(surface)
-        overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
+        overlay = self._overlay
+        if overlay is None or overlay.get_size() != surface.get_size():
+            overlay = self._overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 180))
         surface.blit(overlay, (0, 0))
+        cache = self._text_cache
         for idx, option in enumerate(self.options):
             color = (255, 255, 255) if idx == self.selection else (150, 150, 150)
-            text = self.font.render(option, True, color)
+            text = _render_cached(cache, self.font, option, color)
             surface.blit(text, (surface.get_width() // 2 - text.get_width() // 2, 260 + idx * 60))
 
 
+# Timeline actions the stage understands, each served by a matching
+# ``_handle_<action>`` method on StageState.
+_SPAWN_ACTIONS = ("spawn", "powerup", "hostage", "barrel", "crate", "boss", "camera_pan")
+
+# Number-key weapon order; WEAPON_DATA is immutable at runtime.
+_WEAPON_KEYS = tuple(WEAPON_DATA)
+
+
+@lru_cache(maxsize=128)
+def _stage_path(base: Path, stage_id: str) -> Path:
+    return base / "data" / f"{stage_id}.json"
+
+
+@dataclass(slots=True)
+class StageStats:
+    """Per-stage counters; slot access beats dict hashing in the hot paths."""
+
+    shots_fired: int = 0
+    hits: int = 0
+    hostages_saved: int = 0
+    hostages_lost: int = 0
+    damage_taken: int = 0
+    best_combo: int = 0
+    barrel_multi_kill: int = 0
+
+
+@dataclass(slots=True)
+class Bomb:
+    position: pygame.Vector2
+    timer: float
+
+
 class StageState(Scene):
     def __init__(self, game, stage_id: str) -> None:
         self.game = game
         self.stage_id = stage_id
         stage_path = self._resolve_stage_path(stage_id)
-        self.script = StageScript.from_json(stage_path)
+        self.script = StageScript.load(stage_path)
         self.hud = HUD(game.fonts)
         self.particles = ParticleSystem()
         self.player = Player((240, 620), self.hud, self.particles)
         self.ground_y = 620
         self.enemies: List[Enemy] = []
+        self.enemy_hash = SpatialHash()
+        self.target_index = TargetIndex()
         self.hostages: List[Hostage] = []
         self.powerups: List[Powerup] = []
         self.objects: List = []
         self.boss: Optional[Boss] = None
-        self.bombs: List[dict] = []
+        self.bombs: List[Bomb] = []
         self.score = 0
         self.coins_earned = 0
         self.stage_time = 0.0
         self.completed = False
         self.failed = False
         self.background_layers = self._create_parallax(self.script.zone)
+        self._bg_cache: Optional[pygame.Surface] = None
+        self._bg_offsets: Optional[tuple] = None
         self.camera = self.game.camera
         self.camera.position.x = 0
         self.camera.set_target(0)
         self.spawner = Spawner(self.script, {
-            "spawn": self._handle_spawn,
-            "powerup": self._handle_powerup,
-            "hostage": self._handle_hostage,
-            "barrel": self._handle_barrel,
-            "crate": self._handle_crate,
-            "boss": self._handle_boss,
-            "camera_pan": self._handle_camera_pan,
+            name: getattr(self, f"_handle_{name}") for name in _SPAWN_ACTIONS
         })
-        self.stats = {
-            "shots_fired": 0,
-            "hits": 0,
-            "hostages_saved": 0,
-            "hostages_lost": 0,
-            "damage_taken": 0,
-            "best_combo": 0,
-            "barrel_multi_kill": 0,
-        }
+        self.stats = StageStats()
         self.combo_text_timer = 0.0
         self.music_started = False
+        self.cursor_world = pygame.Vector2(0, 0)
+        # Blit batch recycled across frames by draw().
+        self._actor_batch: List[tuple] = []
 
     def _resolve_stage_path(self, stage_id: str) -> Path:
-        return self.game.base_path / "data" / f"{stage_id}.json"
+        return _stage_path(self.game.base_path, stage_id)
 
     def _create_parallax(self, zone: str) -> List[pygame.Surface]:
         width, height = self.game.display.get_size()
@@ -308,6 +382,8 @@ class StageState(Scene):
 
     def enter(self) -> None:
         self.game.audio.play_music(self.script.music, loop=True)
+        # Unlocks only change in the shop, which cannot run mid-stage.
+        self._weapon_unlocks = self.game.save.get_weapon_unlocks()
 
     def handle_event(self, event) -> None:
         if event.type == pygame.KEYDOWN:
@@ -316,50 +392,64 @@ class StageState(Scene):
             elif event.key == pygame.K_r:
                 self.player.reload()
             elif event.key in (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4):
-                weapons = list(WEAPON_DATA.keys())
                 idx = event.key - pygame.K_1
-                if idx < len(weapons) and self.game.save.get_weapon_unlocks().get(weapons[idx], False):
-                    self.player.switch_weapon(weapons[idx])
-        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == BUTTON_RIGHT:
-            if not self.player.is_ducking():
-                self.player.begin_duck()
-                self.register_duck()
+                if idx < len(_WEAPON_KEYS) and self._weapon_unlocks.get(_WEAPON_KEYS[idx], False):
+                    self.player.switch_weapon(_WEAPON_KEYS[idx])
 
     def update(self, dt: float) -> None:
         if self.failed or self.completed:
             return
         self.stage_time += dt
+        self.cursor_world = self.camera.screen_to_world(pygame.mouse.get_pos())
         self.player.update(dt, self)
         self.particles.update(dt)
         self.spawner.update(dt)
         self._update_lists(dt)
+        self.enemy_hash.rebuild(self.enemies)
+        self.target_index.rebuild(self.get_shoot_targets())
         self.camera.update(dt)
         self.hud.update(dt)
         self._update_bombs(dt)
-        input_manager = self.game.input
-        if input_manager.was_pressed(BUTTON_LEFT):
+        # Both duck triggers (space and right-click) go through the input
+        # manager's per-frame state, so one polled check covers them and
+        # register_duck fires at most once per frame.
+        was_pressed = self.game.input.was_pressed
+        if was_pressed(BUTTON_LEFT):
             self.player.shoot(self)
-        if input_manager.was_pressed(pygame.K_SPACE):
-            if not self.player.is_ducking():
-                self.player.begin_duck()
-                self.register_duck()
+        if (was_pressed(pygame.K_SPACE) or was_pressed(BUTTON_RIGHT)) and not self.player.is_ducking():
+            self.player.begin_duck()
+            self.register_duck()
         if self.stage_time >= self.script.duration and not self.enemies and not self.boss:
             self.complete_stage()
 
     def _update_lists(self, dt: float) -> None:
-        time_scale = 0.6 if self.player.powerups.get("slow", 0) > 0 else 1.0
+        # slow_active is maintained by the player's powerup bookkeeping, so
+        # the scaled dt is one multiply per frame, not one per actor.
+        scaled_dt = dt * 0.6 if self.player.slow_active else dt
+        # In-place write-pointer rebuilds: no list() copy per frame and no
+        # O(n) remove() scan per dead actor.
         for collection in (self.enemies, self.hostages, self.objects):
-            for actor in list(collection):
-                actor.update(dt * time_scale, self)
-                if not actor.alive:
-                    collection.remove(actor)
-        for powerup in list(self.powerups):
+            write = 0
+            for actor in collection:
+                actor.update(scaled_dt, self)
+                if actor.alive:
+                    collection[write] = actor
+                    write += 1
+            del collection[write:]
+        powerups = self.powerups
+        player_rect = self.player.rect
+        px = player_rect.centerx
+        write = 0
+        for powerup in powerups:
             powerup.update(dt, self)
-            if self.player.rect.colliderect(powerup.rect):
+            # Cheap x-distance reject before the rect intersection: 64
+            # covers half the player width (40) plus half a powerup (20).
+            if abs(powerup.rect.centerx - px) < 64 and player_rect.colliderect(powerup.rect):
                 self._collect_powerup(powerup)
-                self.powerups.remove(powerup)
-            elif not powerup.alive:
-                self.powerups.remove(powerup)
+            elif powerup.alive:
+                powerups[write] = powerup
+                write += 1
+        del powerups[write:]
         if self.boss:
             if self.boss.alive:
                 self.boss.update(dt, self)
@@ -367,37 +457,62 @@ class StageState(Scene):
                 self.boss = None
 
     def _update_bombs(self, dt: float) -> None:
-        for bomb in list(self.bombs):
-            bomb["timer"] -= dt
-            if bomb["timer"] <= 0:
-                self.spawn_hit_spark(bomb["position"])
+        bombs = self.bombs
+        write = 0
+        for bomb in bombs:
+            bomb.timer -= dt
+            if bomb.timer <= 0:
+                self.spawn_hit_spark(bomb.position)
                 if not self.player.is_ducking():
                     self.damage_player(1)
-                self.bombs.remove(bomb)
+            else:
+                bombs[write] = bomb
+                write += 1
+        del bombs[write:]
 
     def draw(self, surface) -> None:
         surface.fill((0, 0, 0))
         self._draw_background(surface)
-        for obj in self.objects:
-            obj.draw(surface, self.camera)
-        for hostage in self.hostages:
-            hostage.draw(surface, self.camera)
-        for enemy in self.enemies:
-            enemy.draw(surface, self.camera)
+        camera = self.camera
+        visible = camera.visible
+        # Actors append prerendered sprites to one batch, so each layer is
+        # a single blits call instead of a blit per shape per actor.
+        batch = self._actor_batch
+        batch.clear()
+        for collection in (self.objects, self.hostages, self.enemies):
+            for actor in collection:
+                if visible(actor.rect):
+                    actor.draw_batch(batch, camera)
+        if batch:
+            surface.blits(batch, doreturn=0)
         if self.boss:
             self.boss.draw(surface, self.camera)
+        batch.clear()
         for powerup in self.powerups:
-            powerup.draw(surface, self.camera)
+            if visible(powerup.rect):
+                powerup.draw_batch(batch, camera)
+        if batch:
+            surface.blits(batch, doreturn=0)
         self.player.draw(surface, self.camera)
         self.particles.draw(surface, self.camera)
         self.hud.draw(surface, self)
 
     def _draw_background(self, surface) -> None:
-        for idx, layer in enumerate(self.background_layers):
-            offset = int(self.camera.position.x * (0.1 * idx))
-            x = -offset % layer.get_width()
-            surface.blit(layer, (x - layer.get_width(), 0))
-            surface.blit(layer, (x, 0))
+        # The composed backdrop only depends on the integer parallax
+        # offsets, so the eight layer blits are redone just when the camera
+        # crosses a pixel boundary; otherwise it is one cached blit.
+        camera_x = self.camera.position.x
+        offsets = tuple(int(camera_x * (0.1 * idx)) for idx in range(len(self.background_layers)))
+        cache = self._bg_cache
+        if cache is None or cache.get_size() != surface.get_size() or offsets != self._bg_offsets:
+            if cache is None or cache.get_size() != surface.get_size():
+                cache = self._bg_cache = pygame.Surface(surface.get_size())
+            for idx, layer in enumerate(self.background_layers):
+                x = -offsets[idx] % layer.get_width()
+                cache.blit(layer, (x - layer.get_width(), 0))
+                cache.blit(layer, (x, 0))
+            self._bg_offsets = offsets
+        surface.blit(cache, (0, 0))
 
     # Spawn handlers -----------------------------------------------------
     def _handle_spawn(self, event) -> None:
@@ -457,12 +572,13 @@ class StageState(Scene):
         return targets
 
     def register_hit(self, headshot: bool = False) -> None:
-        self.stats["shots_fired"] += 1
-        self.stats["hits"] += 1
+        stats = self.stats
+        stats.shots_fired += 1
+        stats.hits += 1
         self.player.combo_hits += 1
         self.player.combo_decay = 2.0
         self.player.combo_multiplier = clamp(1.0 + self.player.combo_hits / 5, 1.0, 5.0)
-        self.stats["best_combo"] = max(self.stats["best_combo"], self.player.combo_hits)
+        stats.best_combo = max(stats.best_combo, self.player.combo_hits)
         bonus = 100 * self.player.combo_multiplier
         if headshot:
             bonus += 50
@@ -471,7 +587,7 @@ class StageState(Scene):
         self.hud.set_combo(f"x{self.player.combo_multiplier:.1f}")
 
     def register_miss(self) -> None:
-        self.stats["shots_fired"] += 1
+        self.stats.shots_fired += 1
         self.player.combo_hits = 0
         self.player.combo_multiplier = 1.0
         self.player.combo_decay = 0.0
@@ -487,13 +603,13 @@ class StageState(Scene):
         self.hud.add_message("Enemy down", (200, 220, 255))
 
     def on_hostage_hit(self, hostage: Hostage) -> None:
-        self.stats["hostages_lost"] += 1
+        self.stats.hostages_lost += 1
         self.score -= 200
         self.hud.add_message("Civilian hit!", (255, 80, 80))
         self.register_miss()
 
     def on_hostage_rescued(self, hostage: Hostage) -> None:
-        self.stats["hostages_saved"] += 1
+        self.stats.hostages_saved += 1
         self.score += 250
         self.player.heal(1)
         self.hud.add_message("Hostage rescued", (120, 255, 160))
@@ -501,12 +617,15 @@ class StageState(Scene):
     def on_barrel_exploded(self, barrel) -> None:
         self.hud.add_message("Kaboom!", (255, 200, 80))
         kills = 0
-        for enemy in list(self.enemies):
-            if enemy.rect.centerx in range(barrel.rect.centerx - 120, barrel.rect.centerx + 120):
+        cx = barrel.rect.centerx
+        # Same narrowing the spread shot uses: only the hash buckets around
+        # the blast are scanned instead of the full enemy list.
+        for enemy in self.enemy_hash.query_range(cx - 120, cx + 120):
+            if abs(enemy.rect.centerx - cx) <= 120:
                 enemy.take_damage(200, self)
                 if not enemy.alive:
                     kills += 1
-        self.stats["barrel_multi_kill"] = max(self.stats["barrel_multi_kill"], kills)
+        self.stats.barrel_multi_kill = max(self.stats.barrel_multi_kill, kills)
         self.spawn_hit_spark(barrel.rect.center)
 
     def on_coin_crate_broken(self, crate) -> None:
@@ -515,10 +634,10 @@ class StageState(Scene):
         self.hud.add_message(f"+{crate.coins} coins", (255, 220, 140))
 
     def spawn_hit_spark(self, position) -> None:
-        self.particles.spawn(pygame.Vector2(position), pygame.Vector2(0, 0), 0.2, (255, 200, 120), 6)
+        self.particles.spawn_xy(position[0], position[1], 0, 0, 0.2, (255, 200, 120), 6)
 
     def spawn_bomb(self, position) -> None:
-        self.bombs.append({"position": pygame.Vector2(position), "timer": 1.2})
+        self.bombs.append(Bomb(pygame.Vector2(position), 1.2))
 
     def _collect_powerup(self, powerup: Powerup) -> None:
         if powerup.type == "health":
@@ -539,7 +658,7 @@ class StageState(Scene):
 
     def damage_player(self, amount: int) -> None:
         self.player.take_damage(amount, self)
-        self.stats["damage_taken"] += amount
+        self.stats.damage_taken += amount
 
     def on_player_hit(self) -> None:
         self.register_duck()
@@ -564,11 +683,12 @@ class StageState(Scene):
             self.game.scene_manager.replace(StageClearState(self.game, self, success=True, stats=stats, stars=stars))
 
     def _compile_stats(self) -> dict:
+        stats = self.stats
         accuracy = 0.0
-        if self.stats["shots_fired"]:
-            accuracy = self.stats["hits"] / self.stats["shots_fired"]
+        if stats.shots_fired:
+            accuracy = stats.hits / stats.shots_fired
         return {
-            **self.stats,
+            **asdict(stats),
             "accuracy": accuracy,
             "score": self.score,
             "time": self.stage_time,
@@ -592,6 +712,7 @@ class StageClearState(Scene):
         self.stars = stars
         self.font_title = game.fonts.get("arial", 54)
         self.font = game.fonts.get("arial", 28)
+        self._text_cache: dict = {}
 
     def handle_event(self, event) -> None:
         if event.type == pygame.KEYDOWN:
@@ -607,12 +728,13 @@ class StageClearState(Scene):
 
     def draw(self, surface) -> None:
         surface.fill((18, 20, 26))
+        cache = self._text_cache
         title_text = "Stage Clear" if self.success else "Mission Failed"
-        title = self.font_title.render(title_text, True, (255, 220, 160))
+        title = _render_cached(cache, self.font_title, title_text, (255, 220, 160))
         surface.blit(title, (surface.get_width() // 2 - title.get_width() // 2, 120))
         if self.success:
             stars = "★" * self.stars
-            star_surface = self.font.render(stars, True, (255, 220, 80))
+            star_surface = _render_cached(cache, self.font, stars, (255, 220, 80))
             surface.blit(star_surface, (surface.get_width() // 2 - star_surface.get_width() // 2, 200))
             lines = [
                 f"Score: {self.stage_state.score}",
@@ -621,8 +743,8 @@ class StageClearState(Scene):
                 f"Hostages saved: {self.stats.get('hostages_saved', 0)}",
             ]
             for idx, line in enumerate(lines):
-                text = self.font.render(line, True, (220, 220, 220))
+                text = _render_cached(cache, self.font, line, (220, 220, 220))
                 surface.blit(text, (surface.get_width() // 2 - text.get_width() // 2, 280 + idx * 40))
         else:
-            text = self.font.render("Press Enter to retry", True, (220, 220, 220))
+            text = _render_cached(cache, self.font, "Press Enter to retry", (220, 220, 220))
             surface.blit(text, (surface.get_width() // 2 - text.get_width() // 2, 260))
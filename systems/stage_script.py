@@ -1,13 +1,21 @@
 """Stage scripting parsing and helpers."""
 from __future__ import annotations
 
-import json
+try:  # orjson parses straight from bytes and is several times faster
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Tuple
 
+# Parsed scripts keyed by path, with the file's mtime so an edited stage
+# re-parses. Restarting a stage skips disk I/O and JSON work entirely.
+_SCRIPT_CACHE: Dict[str, Tuple[int, "StageScript"]] = {}
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class TimelineEvent:
     time: float
     action: str
@@ -24,19 +32,37 @@ class StageScript:
     music: str
     difficulty: Dict[str, float]
 
+    @classmethod
+    def load(cls, path: Path) -> "StageScript":
+        """Return the cached parse of ``path``, refreshing if it changed."""
+        key = str(path)
+        mtime = path.stat().st_mtime_ns
+        cached = _SCRIPT_CACHE.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        script = cls.from_json(path)
+        _SCRIPT_CACHE[key] = (mtime, script)
+        return script
+
     @classmethod
     def from_json(cls, path: Path) -> "StageScript":
-        data = json.loads(path.read_text())
+        data = _loads(path.read_bytes())
         timeline = [
             TimelineEvent(time=entry["time"], action=entry["action"], params=entry.get("params", {}))
             for entry in data.get("timeline", [])
         ]
         duration = data.get("duration", max((event.time for event in timeline), default=0) + 5.0)
+        # Stage files are authored sorted (tools/sort_stage_timelines.py),
+        # so the common case is a linear check; sorting is just a fallback
+        # for hand-edited files.
+        times = [event.time for event in timeline]
+        if any(a > b for a, b in zip(times, times[1:])):
+            timeline.sort(key=lambda e: e.time)
         return cls(
             stage_id=data["id"],
             zone=data.get("zone", "City"),
             background=data.get("background", "city"),
-            timeline=sorted(timeline, key=lambda e: e.time),
+            timeline=timeline,
             duration=duration,
             music=data.get("music", "city_theme.ogg"),
             difficulty=data.get("difficulty", {"Easy": 0.9, "Normal": 1.0, "Hard": 1.2}),
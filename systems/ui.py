@@ -1,13 +1,19 @@
 """UI drawing utilities and HUD."""
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Tuple
 
 import pygame
 
-from utils.tween import ease_out_back
+# HUD strings churn (score, timers), so the render cache is bounded and
+# evicts least-recently-used entries instead of growing forever.
+_TEXT_CACHE_SIZE = 256
+
+# Scale steps for the combo popup ramp; 16 steps are visually smooth.
+_COMBO_STEPS = 16
 
 
 class FontLibrary:
@@ -28,7 +34,7 @@ class FontLibrary:
         return self.cache[key]
 
 
-@dataclass
+@dataclass(slots=True)
 class HUDMessage:
     text: str
     timer: float
@@ -40,13 +46,66 @@ class HUD:
 
     def __init__(self, fonts: FontLibrary) -> None:
         self.fonts = fonts
+        # The HUD only ever uses these two; resolve them once instead of a
+        # library lookup per frame.
+        self._font_small = fonts.get("arial", 24)
+        self._font_big = fonts.get("arial", 48)
         self.messages: List[HUDMessage] = []
         self.combo_popup_time = 0.0
         self.combo_text = ""
         self.combo_scale = 0.0
         self.powerup_timers: Dict[str, float] = {}
+        self._text_cache: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self._combo_ladders: Dict[str, List[pygame.Surface]] = {}
+        self._combo_ladder: List[pygame.Surface] = []
+        # Blit batch recycled across frames by draw().
+        self._blits: List[tuple] = []
+        self._heart_full = self._heart_sprite((240, 80, 90))
+        self._heart_empty = self._heart_sprite((80, 80, 80))
+        # Last formatted values, so f-strings only run on change.
+        self._ammo_key: Tuple[int, int] | None = None
+        self._ammo_surface: pygame.Surface | None = None
+        self._score_key: int | None = None
+        self._score_surface: pygame.Surface | None = None
+        self._powerup_surfaces: Dict[str, Tuple[int, pygame.Surface]] = {}
+
+    @staticmethod
+    def _heart_sprite(color) -> pygame.Surface:
+        sprite = pygame.Surface((24, 24), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, (12, 12), 12)
+        return sprite
+
+    def _render_cached(self, font: pygame.font.Font, text: str, color) -> pygame.Surface:
+        """Rasterize ``text`` once per (font, text, color) and reuse it."""
+        key = (id(font), text, color)
+        cache = self._text_cache
+        surface = cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color).convert_alpha()
+            cache[key] = surface
+            if len(cache) > _TEXT_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return surface
 
     def set_combo(self, text: str) -> None:
+        # Combo strings repeat (x1.2, x1.4, ...), so each gets a ladder of
+        # pre-scaled surfaces built once; draw() then picks the nearest
+        # step instead of resampling with rotozoom every frame.
+        ladder = self._combo_ladders.get(text)
+        if ladder is None:
+            base = self._render_cached(self._font_big, text, (255, 220, 80))
+            width, height = base.get_size()
+            ladder = [
+                pygame.transform.smoothscale(
+                    base,
+                    (max(1, int(width * scale)), max(1, int(height * scale))),
+                )
+                for scale in (0.6 + 0.4 * step / (_COMBO_STEPS - 1) for step in range(_COMBO_STEPS))
+            ]
+            self._combo_ladders[text] = ladder
+        self._combo_ladder = ladder
         self.combo_text = text
         self.combo_popup_time = 0.8
         self.combo_scale = 0.0
@@ -58,49 +117,80 @@ class HUD:
         self.powerup_timers[name] = time_left
 
     def update(self, dt: float) -> None:
-        for message in list(self.messages):
+        # Write-pointer compaction instead of a list() copy plus an O(n)
+        # remove per expired message.
+        messages = self.messages
+        write = 0
+        for message in messages:
             message.timer -= dt
-            if message.timer <= 0:
-                self.messages.remove(message)
+            if message.timer > 0:
+                messages[write] = message
+                write += 1
+        del messages[write:]
         if self.combo_popup_time > 0:
             self.combo_popup_time -= dt
             self.combo_scale = min(1.0, self.combo_scale + dt * 3)
         else:
             self.combo_text = ""
             self.combo_scale = 0.0
-        for key in list(self.powerup_timers.keys()):
-            self.powerup_timers[key] = max(0.0, self.powerup_timers[key] - dt)
-            if self.powerup_timers[key] == 0.0:
-                self.powerup_timers.pop(key)
+        timers = self.powerup_timers
+        if timers:
+            # One pass that rebuilds the survivors; expired entries simply
+            # fall out instead of being popped one by one.
+            self.powerup_timers = {
+                key: remaining
+                for key, time_left in timers.items()
+                if (remaining := time_left - dt) > 0.0
+            }
 
     def draw(self, surface: pygame.Surface, stage_state) -> None:  # pragma: no cover - drawing
         white = (230, 230, 230)
-        red = (240, 80, 90)
-        font_small = self.fonts.get("arial", 24)
-        font_big = self.fonts.get("arial", 48)
-        # Draw health hearts
+        font_small = self._font_small
+        font_big = self._font_big
+        width = surface.get_width()
+        height = surface.get_height()
+        # All sprites and text surfaces come from caches, so the frame is
+        # one batched blits call instead of a draw or blit per element.
+        blits = self._blits
+        blits.clear()
+        append = blits.append
+        # Health hearts
+        health = stage_state.player.health
+        heart_full = self._heart_full
+        heart_empty = self._heart_empty
         for i in range(stage_state.player.max_health):
-            color = red if i < stage_state.player.health else (80, 80, 80)
-            pygame.draw.circle(surface, color, (40 + i * 32, 40), 12)
+            append((heart_full if i < health else heart_empty, (28 + i * 32, 28)))
         # Ammo display
-        ammo_text = f"{stage_state.player.ammo}/{stage_state.player.weapon.mag_size}"
-        ammo_surface = font_big.render(ammo_text, True, white)
-        surface.blit(ammo_surface, (surface.get_width() - ammo_surface.get_width() - 40, surface.get_height() - 80))
+        player = stage_state.player
+        ammo_key = (player.ammo, player.weapon.mag_size)
+        if ammo_key != self._ammo_key:
+            self._ammo_key = ammo_key
+            self._ammo_surface = self._render_cached(font_big, f"{ammo_key[0]}/{ammo_key[1]}", white)
+        ammo_surface = self._ammo_surface
+        append((ammo_surface, (width - ammo_surface.get_width() - 40, height - 80)))
         # Score
-        score_surface = font_small.render(f"Score: {stage_state.score}", True, white)
-        surface.blit(score_surface, (40, surface.get_height() - 60))
+        if stage_state.score != self._score_key:
+            self._score_key = stage_state.score
+            self._score_surface = self._render_cached(font_small, f"Score: {stage_state.score}", white)
+        append((self._score_surface, (40, height - 60)))
         # Combo popup
-        if self.combo_text:
-            scale = ease_out_back(self.combo_scale)
-            combo_surface = font_big.render(self.combo_text, True, (255, 220, 80))
-            combo_surface = pygame.transform.rotozoom(combo_surface, 0, 0.6 + 0.4 * scale)
-            rect = combo_surface.get_rect(center=(surface.get_width() // 2, 120))
-            surface.blit(combo_surface, rect)
+        if self.combo_text and self._combo_ladder:
+            # ease_out_back inlined (default overshoot 1.70158): saves a
+            # function call per frame while the popup is live.
+            t = self.combo_scale - 1.0
+            step = int((t * t * (2.70158 * t + 1.70158) + 1.0) * (_COMBO_STEPS - 1))
+            combo_surface = self._combo_ladder[min(max(step, 0), _COMBO_STEPS - 1)]
+            append((combo_surface, combo_surface.get_rect(center=(width // 2, 120))))
         # Messages
         for idx, message in enumerate(self.messages):
-            message_surface = font_small.render(message.text, True, message.color)
-            surface.blit(message_surface, (40, 80 + idx * 28))
-        # Powerups
+            append((self._render_cached(font_small, message.text, message.color), (40, 80 + idx * 28)))
+        # Powerups, quantized to the displayed tenth of a second.
+        powerup_surfaces = self._powerup_surfaces
         for idx, (name, time_left) in enumerate(self.powerup_timers.items()):
-            timer_surface = font_small.render(f"{name}: {time_left:0.1f}s", True, (80, 200, 255))
-            surface.blit(timer_surface, (surface.get_width() - 240, 80 + idx * 26))
+            tenths = round(time_left * 10)
+            cached = powerup_surfaces.get(name)
+            if cached is None or cached[0] != tenths:
+                rendered = self._render_cached(font_small, f"{name}: {tenths / 10:0.1f}s", (80, 200, 255))
+                powerup_surfaces[name] = cached = (tenths, rendered)
+            append((cached[1], (width - 240, 80 + idx * 26)))
+        surface.blits(blits, doreturn=0)
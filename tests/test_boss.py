@@ -0,0 +1,39 @@
+"""Test harness for boss phase transitions."""
+from __future__ import annotations
+
+import pygame
+
+from actors.boss import Boss, BossPhase
+
+
+def make_boss() -> Boss:
+    phases = [
+        BossPhase(threshold=0.9, weak_spots=[pygame.Rect(60, 40, 40, 40)], attack_interval=2.5),
+        BossPhase(threshold=0.6, weak_spots=[pygame.Rect(80, 20, 60, 60)], attack_interval=2.0),
+        BossPhase(threshold=0.3, weak_spots=[pygame.Rect(40, 80, 80, 40)], attack_interval=1.6),
+    ]
+    return Boss((900, 620), max_health=600, phases=phases)
+
+
+def test_phase_advances_as_health_drops():
+    boss = make_boss()
+    boss._update_phase()
+    assert boss.phase_index == 0
+    boss.health = 500
+    boss._update_phase()
+    assert boss.phase_index == 0
+    boss.health = 300
+    boss._update_phase()
+    assert boss.phase_index == 1
+    boss.health = 100
+    boss._update_phase()
+    assert boss.phase_index == 2
+
+
+def test_attack_timer_only_resets_on_transition():
+    boss = make_boss()
+    boss.health = 500
+    boss._update_phase()
+    boss.attack_timer = 0.4
+    boss._update_phase()
+    assert boss.attack_timer == 0.4
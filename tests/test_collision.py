@@ -0,0 +1,53 @@
+"""Test harness for collision helpers."""
+from __future__ import annotations
+
+import pygame
+
+from systems.collision import SpatialHash, TargetIndex, hitscan
+
+
+class DummyActor:
+    def __init__(self, centerx: int, alive: bool = True) -> None:
+        self.rect = pygame.Rect(0, 0, 64, 64)
+        self.rect.center = (centerx, 100)
+        self.alive = alive
+
+
+def test_spatial_hash_query_range():
+    actors = [DummyActor(x) for x in (50, 150, 400, 900)]
+    grid = SpatialHash(cell_size=120)
+    grid.rebuild(actors)
+    nearby = list(grid.query_range(0, 200))
+    assert actors[0] in nearby
+    assert actors[1] in nearby
+    assert actors[3] not in nearby
+
+
+def test_target_index_prefers_earlier_targets():
+    overlapping = [DummyActor(100), DummyActor(110)]
+    index = TargetIndex()
+    index.rebuild(overlapping)
+    assert index.pick(pygame.Vector2(105, 100)) is overlapping[0]
+    assert index.pick(pygame.Vector2(5000, 100)) is None
+
+
+def test_target_index_skips_dead_targets():
+    actors = [DummyActor(100, alive=False), DummyActor(110)]
+    index = TargetIndex()
+    index.rebuild(actors)
+    assert index.pick(pygame.Vector2(105, 100)) is actors[1]
+
+
+def test_hitscan_returns_first_hit():
+    actors = [DummyActor(100), DummyActor(110)]
+    hit = hitscan(pygame.Vector2(105, 100), actors)
+    assert hit is actors[0]
+    assert hitscan(pygame.Vector2(5000, 100), actors) is None
+
+
+def test_hitscan_with_spatial_hash():
+    actors = [DummyActor(100), DummyActor(900)]
+    grid = SpatialHash(cell_size=120)
+    grid.rebuild(actors)
+    assert hitscan(pygame.Vector2(100, 100), actors, spatial_hash=grid) is actors[0]
+    assert hitscan(pygame.Vector2(500, 100), actors, spatial_hash=grid) is None
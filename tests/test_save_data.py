@@ -12,6 +12,7 @@ def test_save_data_roundtrip(tmp_path):
     save.add_coins(50)
     save.unlock_weapon("smg")
     save.set_stage_result("stage_city_01", 3, 1200)
+    save.flush()
     save2 = SaveData(path)
     assert save2.data["coins"] >= 50
     assert save2.get_weapon_unlocks()["smg"] is True
@@ -0,0 +1,29 @@
+"""One-shot authoring tool: sort every stage timeline by event time.
+
+Keeps the stage JSONs in the order the runtime wants so loading never
+has to sort. Run from the repo root after editing stage files:
+
+    python tools/sort_stage_timelines.py
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+
+def sort_timelines(data_dir: Path) -> int:
+    changed = 0
+    for path in sorted(data_dir.glob("stage_*.json")):
+        data = json.loads(path.read_text())
+        timeline = data.get("timeline", [])
+        ordered = sorted(timeline, key=lambda entry: entry["time"])
+        if ordered != timeline:
+            data["timeline"] = ordered
+            path.write_text(json.dumps(data, indent=2) + "\n")
+            changed += 1
+    return changed
+
+
+if __name__ == "__main__":
+    count = sort_timelines(Path(__file__).resolve().parent.parent / "data")
+    print(f"rewrote {count} stage file(s)")
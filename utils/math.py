@@ -1,6 +1,7 @@
 """Mathematical helpers used across the project."""
 from __future__ import annotations
 
+from statistics import fmean
 from typing import Iterable
 
 
@@ -16,16 +17,15 @@ def lerp(a: float, b: float, t: float) -> float:
 
 def approach(current: float, target: float, delta: float) -> float:
     """Move ``current`` toward ``target`` by ``delta`` without overshooting."""
-    if current < target:
-        return min(target, current + delta)
-    if current > target:
-        return max(target, current - delta)
-    return current
+    # Branchless: the clamped difference is the step in either direction.
+    return current + max(-delta, min(delta, target - current))
 
 
 def moving_average(values: Iterable[float]) -> float:
     """Return the average of an iterable of floats; returns 0.0 for empty iterables."""
-    values = list(values)
-    if not values:
+    # fmean consumes the iterable in C in a single pass, with no
+    # intermediate list and better float accuracy than a naive sum.
+    try:
+        return fmean(values)
+    except ValueError:
         return 0.0
-    return sum(values) / len(values)
@@ -3,26 +3,75 @@ from __future__ import annotations
 
 import math
 
+# Curve samples precomputed at import; the public helpers interpolate
+# between neighbouring entries, which is visually indistinguishable from
+# the closed forms and skips the per-call float math.
+_LUT_MAX = 1023
+
 
 def ease_out_quad(t: float) -> float:
     """Quadratic ease-out."""
     return -t * (t - 2)
 
 
-def ease_in_out_cubic(t: float) -> float:
-    """Cubic ease-in/out for smooth transitions."""
+def _raw_ease_in_out_cubic(t: float) -> float:
     if t < 0.5:
         return 4 * t * t * t
     f = (2 * t) - 2
     return 0.5 * f * f * f + 1
 
 
-def ease_out_back(t: float, overshoot: float = 1.70158) -> float:
-    """Back ease-out used for punchy pop-ups."""
+def _raw_ease_out_back(t: float, overshoot: float = 1.70158) -> float:
     t -= 1
     return (t * t * ((overshoot + 1) * t + overshoot)) + 1
 
 
+def _raw_ping_pong(t: float) -> float:
+    return 0.5 * (1 + math.sin(2 * math.pi * (t - 0.25)))
+
+
+_EASE_IN_OUT_CUBIC_LUT = tuple(_raw_ease_in_out_cubic(i / _LUT_MAX) for i in range(_LUT_MAX + 1))
+_EASE_OUT_BACK_LUT = tuple(_raw_ease_out_back(i / _LUT_MAX) for i in range(_LUT_MAX + 1))
+_PING_PONG_LUT = tuple(_raw_ping_pong(i / _LUT_MAX) for i in range(_LUT_MAX + 1))
+
+
+def _sample(lut: tuple, t: float) -> float:
+    idx = t * _LUT_MAX
+    i = int(idx)
+    a = lut[i]
+    return a + (lut[i + 1] - a) * (idx - i) if i < _LUT_MAX else a
+
+
+def ease_in_out_cubic(t: float) -> float:
+    """Cubic ease-in/out for smooth transitions."""
+    if t <= 0.0:
+        return _EASE_IN_OUT_CUBIC_LUT[0]
+    if t >= 1.0:
+        return _EASE_IN_OUT_CUBIC_LUT[_LUT_MAX]
+    return _sample(_EASE_IN_OUT_CUBIC_LUT, t)
+
+
+def ease_out_back_default(t: float) -> float:
+    """``ease_out_back`` specialized for the default overshoot.
+
+    Skips the overshoot compare and default-argument handling; hot
+    per-frame callers should prefer this variant.
+    """
+    if t <= 0.0:
+        return _EASE_OUT_BACK_LUT[0]
+    if t >= 1.0:
+        return _EASE_OUT_BACK_LUT[_LUT_MAX]
+    return _sample(_EASE_OUT_BACK_LUT, t)
+
+
+def ease_out_back(t: float, overshoot: float = 1.70158) -> float:
+    """Back ease-out used for punchy pop-ups."""
+    if overshoot != 1.70158:
+        return _raw_ease_out_back(t, overshoot)
+    return ease_out_back_default(t)
+
+
 def ping_pong(t: float) -> float:
     """Ping-pong between 0 and 1."""
-    return 0.5 * (1 + math.sin(2 * math.pi * (t - 0.25)))
+    # The curve has period 1, so any t folds into the table range.
+    return _sample(_PING_PONG_LUT, t % 1.0)